@@ -18,11 +18,17 @@ import json
 import re
 from pathlib import Path
 from event_scanner.utils.paths import get_data_dir
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 from collections import defaultdict, Counter
 
 from event_scanner.utils import Logger
 
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 try:
     from rapidfuzz import fuzz, process  # type: ignore
 except ImportError as exc:  # pragma: no cover
@@ -125,13 +131,7 @@ class EventDatabase:
 
             selected_variants = all_variants
             if character_id_filter:
-                matches = [
-                    v for v in all_variants
-                    if any(
-                        s.get('type') == 'character' and str(s.get('id', '')) == character_id_filter
-                        for s in v.get('sources', [])
-                    )
-                ]
+                matches = [v for v in all_variants if character_id_filter in v['_character_ids']]
                 Logger.debug(
                     f"Character id={character_id_filter}: {len(matches)} / {len(all_variants)} variants match (event='{cand_name}')"
                 )
@@ -173,6 +173,10 @@ class EventDatabase:
         """Tăng bộ đếm tần suất cho nguồn *source_name*."""
         self._source_freq[source_name] += 1
 
+    def increment_sources(self, source_names: Iterable[str]):
+        """Tăng bộ đếm cho nhiều nguồn cùng lúc (một lần cập nhật Counter)."""
+        self._source_freq.update(source_names)
+
     def reset_source_freq(self):
         """Xóa bộ đếm nguồn (khi bắt đầu nhân vật/scenario mới)."""
         self._source_freq.clear()
@@ -193,8 +197,7 @@ class EventDatabase:
                 continue
 
             try:
-                with path.open("r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                data = _loads(path.read_bytes())
             except Exception as exc:  # pragma: no cover
                 Logger.error(f"Failed to read {path}: {exc}")
                 continue
@@ -242,12 +245,19 @@ class EventDatabase:
                 Logger.warning(f"Event entry missing ID: {entry}")
                 continue
 
+            sources = id_to_sources.get(event_id, [])
             event_obj = {
                 "name": name,
                 "choices": entry.get("choices", []),
                 "type": entry.get("type", "Unknown"),
-                "sources": id_to_sources.get(event_id, []),
+                "sources": sources,
                 "id": event_id,
+                # Precomputed lookups so matching/rendering never re-walk sources
+                "_source_ids": frozenset(s["id"] for s in sources if s.get("id")),
+                "_character_ids": frozenset(
+                    s["id"] for s in sources if s.get("type") == "character" and s.get("id")
+                ),
+                "_owners": ", ".join(s["name"] for s in sources if s.get("name")) or "?",
             }
 
             self._events.setdefault(norm_name, []).append(event_obj)
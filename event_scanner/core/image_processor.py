@@ -6,11 +6,23 @@ previous GPU-specific and experimental methods have been removed to keep the
 codebase maintainable and fast.
 """
 
+import hashlib
+import threading
 from typing import Any
 
 import cv2
 import numpy as np
 
+# CLAHE objects are stateful, so each thread keeps its own instance
+_tls = threading.local()
+
+
+def _clahe() -> Any:
+    clahe = getattr(_tls, 'clahe', None)
+    if clahe is None:
+        clahe = _tls.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return clahe
+
 
 class ImageProcessor:
     """Basic preprocessing utilities for OCR."""
@@ -20,35 +32,65 @@ class ImageProcessor:
         """Convert *image* to a form that is easier for OCR engines.
 
         Steps performed:
-        1. Convert BGR images to grayscale.
+        1. Convert BGR images to grayscale (single-channel images are used as is).
         2. Apply a bilateral filter to reduce noise while preserving edges.
         3. Run Otsu thresholding to obtain a high-contrast binary image.
         """
         if image is None:
             return image
 
-        # 1) Optional upscale (helps EasyOCR on small UI text)
-        h, w = image.shape[:2]
-        if max(h, w) < 100:  # heuristic: consider tiny banner
-            image = cv2.resize(image, None, fx=2.5, fy=2.5, interpolation=cv2.INTER_CUBIC)
+        # 1) Grayscale conversion first so every later pass touches one channel
+        if image.ndim == 2:
+            gray = image
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
-        # 2) Grayscale conversion
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image.copy()
+        # 2) Optional upscale (helps EasyOCR on small UI text)
+        h, w = gray.shape[:2]
+        if max(h, w) < 100:  # heuristic: consider tiny banner
+            gray = cv2.resize(gray, None, fx=2.5, fy=2.5, interpolation=cv2.INTER_CUBIC)
 
         # 3) Contrast Limited Adaptive Histogram Equalization (CLAHE)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        gray = clahe.apply(gray)
+        gray = _clahe().apply(gray)
 
         # 4) Light de-noising while keeping edges crisp
         gray = cv2.bilateralFilter(gray, d=7, sigmaColor=50, sigmaSpace=50)
 
         # 5) Try binary + Otsu; if text seems lost (mostly white), invert
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        white_ratio = np.mean(thresh == 255)
+        # countNonZero counts white pixels natively (no boolean temp array)
+        white_ratio = cv2.countNonZero(thresh) / thresh.size
         if white_ratio > 0.90:  # too white ⇒ invert mode may be better
-            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+            # Same Otsu level, so the inverse binary image is just the bitwise NOT
+            cv2.bitwise_not(thresh, dst=thresh)
 
         return thresh
 
+    @staticmethod
+    def frame_hash(image: np.ndarray) -> int:
+        """Return a signed 64-bit fingerprint of the raw pixels of *image*.
+
+        Identical frames always hash equal; the value fits an SQLite INTEGER.
+        """
+        digest = hashlib.blake2b(np.ascontiguousarray(image).data, digest_size=8).digest()
+        return int.from_bytes(digest, 'little', signed=True)
+
+    @staticmethod
+    def dhash(image: np.ndarray) -> int:
+        """Return a 64-bit difference hash of *image* (perceptual, jitter tolerant).
+
+        Bits compare horizontally adjacent cells of a 9x8 thumbnail, so small
+        animations flip few bits; compare two hashes with ``hamming``.
+        """
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = np.packbits(small[:, 1:] > small[:, :-1])
+        return int.from_bytes(bits.tobytes(), 'big')
+
+    @staticmethod
+    def hamming(a: int, b: int) -> int:
+        """Number of differing bits between two hashes."""
+        return bin(a ^ b).count('1')
+
 
 __all__ = ["ImageProcessor"] 
\ No newline at end of file
@@ -20,10 +20,15 @@ except ImportError as exc:  # pragma: no cover
         "EasyOCR is required to run the OCR engine. Install it with 'pip install easyocr'."
     ) from exc
 
+# Fewer characters than this from the raw pass triggers the preprocessed retry
+MIN_TEXT_CHARS = 3
+
 
 class OCREngine:
     """A minimal wrapper around EasyOCR."""
 
+    min_chars = MIN_TEXT_CHARS
+
     def __init__(self, language: str = "eng", gpu: bool = False):
         """Create an EasyOCR reader.
 
@@ -58,7 +63,7 @@ class OCREngine:
         raw_texts = self.reader.readtext(image, detail=0)
 
         # 2) If nothing or too few characters detected, fall back to pre-processed image
-        if not raw_texts or len("".join(raw_texts)) < 3:
+        if sum(map(len, raw_texts)) < self.min_chars:
             processed = ImageProcessor.preprocess_for_ocr(image)
             raw_texts = self.reader.readtext(processed, detail=0)
 
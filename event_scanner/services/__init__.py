@@ -2,4 +2,5 @@
 Services package for Uma Event Scanner
 """
 
-from .managers import SettingsManager, HistoryManager 
\ No newline at end of file
+from .managers import SettingsManager, HistoryManager
+from .ocr_cache import OCRCache 
\ No newline at end of file
@@ -2,13 +2,16 @@
 Settings and History Managers for Uma Event Scanner
 """
 
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from event_scanner.utils import Logger, FileManager
 
 # Constants
 SETTINGS_FILE = 'scanner_settings.json'
 HISTORY_FILE = 'event_history.pkl'
+MAX_HISTORY_ENTRIES = 100  # Older entries drop off the end of the session history
 
 DEFAULT_SETTINGS = {
     'scan_interval': 2.0,
@@ -78,8 +81,9 @@ class HistoryManager:
     """Manager for event history (session-only, no disk persistence)"""
     
     def __init__(self):
-        # Keep history only for the current session
-        self.history = []
+        # Keep history only for the current session, newest first; the deque bound
+        # drops the oldest entry in O(1) once full
+        self.history = deque(maxlen=MAX_HISTORY_ENTRIES)
         # Do not load from or save to disk (previously used event_history.pkl)
         Logger.info("History initialised for current session – persistence disabled")
 
@@ -89,32 +93,31 @@ class HistoryManager:
 
     def add_entry(self, event: Dict, texts: List[str]):
         """Add new entry to history (in-memory only)"""
+        now = datetime.now()
         entry = {
-            'timestamp': datetime.now(),
+            'timestamp': now,
+            # Display string formatted once; entries never change after insertion
+            'time_str': now.strftime('%H:%M:%S'),
             'event': event,
             'texts': texts,
         }
-        self.history.insert(0, entry)
-
-        # Keep only the last 100 entries to avoid unbounded growth
-        if len(self.history) > 100:
-            self.history = self.history[:100]
+        self.history.appendleft(entry)
         Logger.debug(f"Added history entry: {event.get('name', 'Unknown')}")
 
     def clear(self):
         """Clear all history for this session"""
-        self.history = []
+        self.history.clear()
         Logger.info("History cleared (session only)")
 
     # All other helper methods (get_history, search, stats …) are unchanged below
     
     def get_history(self) -> List[Dict]:
         """Get all history entries"""
-        return self.history.copy()
+        return list(self.history)
     
     def get_recent_entries(self, count: int = 10) -> List[Dict]:
         """Get recent history entries"""
-        return self.history[:count]
+        return list(islice(self.history, count))
     
     def get_entry_count(self) -> int:
         """Get number of history entries"""
@@ -0,0 +1,105 @@
+"""
+Persistent OCR result cache for Uma Event Scanner
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from event_scanner.utils import Logger
+
+# Constants
+OCR_CACHE_FILE = 'ocr_cache.sqlite3'
+OCR_CACHE_CAPACITY = 4096
+# Number of new/updated entries buffered before they are written to disk
+OCR_CACHE_FLUSH_EVERY = 32
+
+
+class OCRCache:
+    """LRU cache of OCR texts keyed by a 64-bit frame hash, backed by SQLite.
+
+    Lookups and inserts only touch the in-memory ``OrderedDict``; changes are
+    written to disk in batches (and on :meth:`close`) so the scan loop never
+    waits on a commit for every frame.
+    """
+
+    def __init__(self, db_path: str = OCR_CACHE_FILE, capacity: int = OCR_CACHE_CAPACITY):
+        self.capacity = capacity
+        self._entries: "OrderedDict[int, List[str]]" = OrderedDict()
+        self._pending: Dict[int, Tuple[List[str], float]] = {}
+        self._evicted: List[int] = []
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache "
+                "(hash INTEGER PRIMARY KEY, texts TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._warm()
+        except sqlite3.Error as e:
+            Logger.error(f"OCR cache unavailable, using memory only: {e}")
+            self._conn = None
+
+    def _warm(self):
+        """Load the most recently used entries from disk (oldest first)."""
+        rows = self._conn.execute(
+            "SELECT hash, texts FROM ocr_cache ORDER BY last_used DESC LIMIT ?",
+            (self.capacity,),
+        ).fetchall()
+        for key, texts in reversed(rows):
+            self._entries[key] = json.loads(texts)
+        Logger.info(f"OCR cache warmed with {len(self._entries)} entries")
+
+    def get(self, key: int) -> Optional[List[str]]:
+        """Return cached texts for *key* (and mark it recently used) or None."""
+        with self._lock:
+            texts = self._entries.get(key)
+            if texts is not None:
+                self._entries.move_to_end(key)
+                self._pending[key] = (texts, time.time())
+            return texts
+
+    def put(self, key: int, texts: List[str]):
+        """Store *texts* for *key*, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = texts
+            self._entries.move_to_end(key)
+            self._pending[key] = (texts, time.time())
+            while len(self._entries) > self.capacity:
+                old_key, _ = self._entries.popitem(last=False)
+                self._pending.pop(old_key, None)
+                self._evicted.append(old_key)
+            if len(self._pending) >= OCR_CACHE_FLUSH_EVERY:
+                self._flush_locked()
+
+    def flush(self):
+        """Write buffered changes to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._conn is None or not (self._pending or self._evicted):
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ocr_cache (hash, texts, last_used) VALUES (?, ?, ?)",
+                [(k, json.dumps(v, ensure_ascii=False), ts) for k, (v, ts) in self._pending.items()],
+            )
+            self._conn.executemany("DELETE FROM ocr_cache WHERE hash = ?", [(k,) for k in self._evicted])
+            self._conn.commit()
+        except sqlite3.Error as e:
+            Logger.error(f"Failed to flush OCR cache: {e}")
+        self._pending.clear()
+        self._evicted.clear()
+
+    def close(self):
+        """Flush and close the database."""
+        with self._lock:
+            self._flush_locked()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
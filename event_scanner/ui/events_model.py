@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize
+
+
+class EventsModel(QAbstractListModel):
+    """One pre-formatted text line per row for the Training tab's results view.
+
+    The view only asks for the rows it paints, so large result sets cost no
+    document layout up front. Every row reports the same size hint (wide
+    enough for the longest line), which suits a view with uniform item sizes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[str] = []
+        self._row_size: Optional[QSize] = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()]
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self._row_size
+        return None
+
+    def set_rows(self, rows: List[str], row_size: Optional[QSize] = None):
+        """Replace all rows with *rows*; *row_size* is the size hint shared by every row"""
+        self.beginResetModel()
+        self._rows = rows
+        self._row_size = row_size
+        self.endResetModel()
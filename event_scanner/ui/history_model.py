@@ -0,0 +1,69 @@
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+class HistoryModel(QAbstractListModel):
+    """List model over the session history entries (newest first).
+
+    Rows are read straight from the entry dicts, so the view only asks for the
+    rows it paints. ``sync`` inserts/removes just the rows that changed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[Dict] = []
+
+    # ------------------------------------------------------------------
+    # QAbstractListModel interface
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{entry['time_str']} - {entry['event']['name']}"
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def entry(self, row: int) -> Optional[Dict]:
+        """History entry shown at *row*"""
+        return self._entries[row] if 0 <= row < len(self._entries) else None
+
+    def reset(self, entries: List[Dict]):
+        """Replace all rows with *entries*"""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def sync(self, entries: List[Dict]):
+        """Bring the model in line with *entries*, touching only changed rows"""
+        # History is newest-first: everything above the current head is new
+        head = self._entries[0] if self._entries else None
+        new_count = None
+        if head is not None:
+            new_count = next((i for i, e in enumerate(entries) if e is head), None)
+        if new_count is None:
+            # First fill, cleared, or head aged out – rebuild from scratch
+            self.reset(entries)
+            return
+
+        if new_count:
+            self.beginInsertRows(QModelIndex(), 0, new_count - 1)
+            self._entries[0:0] = entries[:new_count]
+            self.endInsertRows()
+        # Drop rows for entries trimmed off the end by the history size cap
+        extra = len(self._entries) - len(entries)
+        if extra > 0:
+            self.beginRemoveRows(QModelIndex(), len(entries), len(self._entries) - 1)
+            del self._entries[len(entries):]
+            self.endRemoveRows()
@@ -5,26 +5,29 @@ Main Window for Uma Event Scanner using PyQt6
 import sys
 import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 import pyautogui
-from datetime import datetime
-from typing import Tuple, Optional, Dict, List
+from typing import Any, Tuple, Optional, Dict, List
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QTabWidget, QFrame, QTextEdit, QListWidget,
-    QMessageBox, QDoubleSpinBox, QCheckBox, QGroupBox, QScrollArea,
+    QPushButton, QTabWidget, QFrame, QTextEdit, QListView,
+    QMessageBox, QDoubleSpinBox, QCheckBox, QGroupBox, QTextBrowser,
     QSplitter, QComboBox, QFileDialog, QApplication, QSpinBox,
-    QTreeWidget, QTreeWidgetItem, QSizePolicy
+    QTreeWidget, QTreeWidgetItem
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, pyqtSlot, QSize, QEvent
 from PyQt6.QtGui import QFont, QPixmap, QImage, QIcon
 
 from event_scanner.core import ImageProcessor, EventDatabase, OCREngine
-from event_scanner.services import SettingsManager, HistoryManager
+from event_scanner.services import SettingsManager, HistoryManager, OCRCache
 from event_scanner.ui import RegionSelector, StatRecommendationsTab
 from event_scanner.ui.character_select_dialog import CharacterSelectDialog
+from event_scanner.ui.history_model import HistoryModel
 # from event_scanner.ui.ai_learning_dialog import AILearningDialog  # Removed AI feature
 from event_scanner.ui.training_events_tab import TrainingEventsTab
 from event_scanner.utils import Logger
@@ -34,6 +37,13 @@ from event_scanner.utils.paths import get_base_dir
 from event_scanner.ui.update_dialog import UpdateDialog
 import pathlib
 
+# Fast screen capture (falls back to pyautogui when mss is not installed)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
 # Import GPU configuration if available
 try:
     from event_scanner.config import GPUConfig, IMAGE_PROCESSING_CONFIG
@@ -63,6 +73,89 @@ SUMMARY_FONT_PT = 13
 SUMMARY_NAME_COLOR = '#F39C12'   # Orange-gold
 SUMMARY_TYPE_COLOR = '#9B59B6'   # Purple
 SUMMARY_OWNER_COLOR = '#16A085'  # Teal
+# Summary label markup; only the text changes per event
+SUMMARY_NAME_HTML = f"<span style='color:{SUMMARY_NAME_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><b>{{}}</b></span>"
+SUMMARY_TYPE_HTML = f"<span style='color:{SUMMARY_TYPE_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><i>{{}}</i></span>"
+SUMMARY_OWNER_HTML = f"<span style='color:{SUMMARY_OWNER_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><b>{{}}</b></span>"
+
+# Number of recent OCR-text -> event lookups kept by the match cache
+MATCH_CACHE_SIZE = 256
+
+# Scan back-off on a static screen: +1x interval per STEP identical frames, up to MAX x
+SCAN_BACKOFF_STEP = 5
+SCAN_BACKOFF_MAX = 4
+# First retry delay (s) after a scan error; doubles per consecutive error, capped at the interval
+SCAN_ERROR_RETRY = 0.25
+# Frames whose dHash differs by at most this many bits count as "static" for the back-off
+DHASH_JITTER_BITS = 3
+
+# Frames whose subsampled pixel std-dev falls below this are treated as blank (no OCR)
+BLANK_STD_THRESHOLD = 8.0
+# _last_emitted_event before anything was emitted (None means "no event" was emitted)
+_NOTHING_EMITTED = object()
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """Shared Arial font (built on first use, after QApplication exists).
+
+    Callers must not modify the returned font; ask for a variant instead.
+    """
+    weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
+    return QFont("Arial", point_size, weight, italic)
+
+
+@lru_cache(maxsize=None)
+def _effect_rule(kind: str) -> Tuple[str, bool]:
+    """Colour rule and show-detail flag for an effect *kind* (memoised: kinds are a small set).
+
+    The rule is 'stat' (colour by stat name), an EFFECT_COLORS key, or '' for no colour.
+    Colours themselves are looked up at render time because they follow the theme.
+    """
+    kind = kind.lower()
+    if kind == 'stat':
+        rule = 'stat'
+    elif 'skill' in kind:
+        rule = 'skill'
+    elif 'bond' in kind:
+        rule = 'bond'
+    elif kind == 'status':
+        rule = 'status'
+    else:
+        rule = ''
+    return rule, kind in {"skill", "status"}
+
+
+@lru_cache(maxsize=None)
+def _load_qss(file_name: str) -> str:
+    """Read a theme stylesheet from the resources folder once ('' if missing)."""
+    qss_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'resources', file_name))
+    if not os.path.exists(qss_path):
+        return ""
+    with open(qss_path, 'r', encoding='utf-8') as fh:
+        return fh.read()
+
+
+# Bytes requested per read of the scraper output pipe (complete lines of each read are sent at once)
+UPDATE_READ_CHUNK = 65536
+
+# Inline stylesheets (built once; scan state styling lives in the theme QSS files)
+SPLITTER_HANDLE_CSS = "QSplitter::handle { background-color: #555; }"
+EMPTY_STATUSBAR_CSS = "QStatusBar{background:transparent;border:none;}"
+
+class ScanThread(QThread):
+    """Qt-managed thread running ``MainWindow.scan_loop``.
+
+    Stopping is cooperative: ``requestInterruption()`` plus waking the loop's
+    sleep, after which ``wait()`` returns within one OCR pass.
+    """
+
+    def __init__(self, window: 'MainWindow'):
+        super().__init__()
+        self._window = window
+
+    def run(self):
+        self._window.scan_loop(self)
+
 
 class MainWindow(QMainWindow):
     """Main window for Uma Event Scanner"""
@@ -71,6 +164,8 @@ class MainWindow(QMainWindow):
     update_results_signal = pyqtSignal(list)
     # Accepts either a dict (event data) or None to indicate no event
     event_detected_signal = pyqtSignal(object)
+    # Emitted by the scan worker after a history entry was added
+    history_updated_signal = pyqtSignal()
     
     def __init__(self):
         super().__init__()
@@ -80,24 +175,60 @@ class MainWindow(QMainWindow):
         self.history = HistoryManager()
         self.event_db = EventDatabase()
         # Apply user-defined threshold at startup
-        from event_scanner.core.event_database import EventDatabase as _EDB
-        _EDB.THRESHOLD_SCORE = int(self.settings.get('match_threshold', 85) or 85)
+        EventDatabase.THRESHOLD_SCORE = int(self.settings.get('match_threshold', 85) or 85)
         # Track the last event name currently displayed to avoid reopening same popup
         self.last_event_name: Optional[str] = None
+        # Event variant last pushed through event_detected_signal, compared by identity:
+        # EventDatabase returns its stored dicts, one per variant
+        self._last_emitted_event: Any = _NOTHING_EMITTED
+        # (name, event identity, character filter) of what the results panel currently shows
+        self._last_rendered_key: Optional[Tuple] = None
+        # Detail panel HTML per event for the current theme: id(event) -> (event, html)
+        self._detail_html_cache: Dict[int, Tuple[Dict, str]] = {}
         # Track an event name that the user manually dismissed so we don't immediately reopen it
         self.dismissed_event_name: Optional[str] = None
         self.ocr_engine = None
         self.selected_character_name: Optional[str] = None
         self.selected_character_id: Optional[str] = None
         self.image_processor = ImageProcessor()
-        
-        from collections import Counter
-        self.source_freq = Counter()
 
         self.scanning = False
         self.scan_region = self.settings.get('last_region')
+        # Scan interval read by the worker each tick; follows the interval spin box
+        self._scan_interval = float(self.settings.get('scan_interval', 2.0) or 2.0)
         self.current_popup = None
-        self.scan_thread = None
+        self.scan_thread: Optional[ScanThread] = None
+        # Set to cut the scan loop's inter-frame sleep short when stopping
+        self._scan_wake = threading.Event()
+        # Double-buffered frames: the scan thread fills one slot while OCR reads the other.
+        # Per slot: grayscale capture buffer (region sized) and size-capped output buffer.
+        self._cap_bufs: List[Optional[np.ndarray]] = [None, None]
+        self._resize_bufs: List[Optional[np.ndarray]] = [None, None]
+        # Hash of the last non-blank frame processed; identical frames are skipped outright
+        self._last_frame_key: Optional[int] = None
+        # Consecutive identical frames seen (drives the scan interval back-off)
+        self._stable_ticks = 0
+        # Perceptual hash of the last non-blank frame (tolerates animation jitter)
+        self._last_dhash: Optional[int] = None
+        # OCR results keyed by frame hash, persisted across sessions
+        self._ocr_cache = OCRCache()
+        # Recent OCR text -> matched event (or None), oldest evicted first
+        self._match_cache: "OrderedDict[Tuple[str, Optional[str]], Optional[Dict]]" = OrderedDict()
+        # Single OCR worker: overlaps screen capture with OCR of the previous frame
+        self._ocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+        # Last formatted results timestamp; re-formatted only when the second changes
+        self._clock_sec = -1
+        self._clock_str = ""
+        
+        # Cache primary screen geometry; refreshed only when the screen setup changes
+        self._screen_geom = None
+        # Primary screen whose geometryChanged (resolution/DPI change) is connected
+        self._watched_screen = None
+        self._refresh_screen_geometry()
+        app = QApplication.instance()
+        app.primaryScreenChanged.connect(self._refresh_screen_geometry)
+        app.screenAdded.connect(self._refresh_screen_geometry)
+        app.screenRemoved.connect(self._refresh_screen_geometry)
         
         # Set window flags to ensure main window stays active and on top
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowStaysOnTopHint)
@@ -116,13 +247,14 @@ class MainWindow(QMainWindow):
         empty_sb = QStatusBar()
         empty_sb.setSizeGripEnabled(False)
         empty_sb.setFixedHeight(0)
-        empty_sb.setStyleSheet("QStatusBar{background:transparent;border:none;}")
+        empty_sb.setStyleSheet(EMPTY_STATUSBAR_CSS)
         self.setStatusBar(empty_sb)
 
         icon_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'resources', 'icon.ico'))
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
         # Apply theme from settings (dark default)
+        self._current_theme: Optional[str] = None
         theme_name = self.settings.get('theme', 'dark')
         self.apply_theme(theme_name)
         self.connect_signals()
@@ -135,6 +267,10 @@ class MainWindow(QMainWindow):
     
     def init_ocr(self):
         """Initialize OCR engine"""
+        # OpenCV kernels already run natively with the GIL released; leave one core
+        # free so the Qt GUI thread stays responsive while a frame is processed.
+        # Set here, not on import, so tools importing event_scanner keep OpenCV's default.
+        cv2.setNumThreads(max(1, (os.cpu_count() or 2) - 1))
         try:
             language = self.settings.get('ocr_language', 'eng') or 'eng'
             use_gpu = bool(self.settings.get('use_gpu', False))
@@ -161,6 +297,9 @@ class MainWindow(QMainWindow):
         # Tab widget
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
+        # Placeholder tab -> (attribute name, factory) for tabs not built yet
+        self._lazy_tabs: Dict[QWidget, Tuple[str, object]] = {}
+        self.tab_widget.currentChanged.connect(self._build_lazy_tab)
         
         self.setup_scanner_tab()
         self.setup_training_events_tab()
@@ -178,20 +317,42 @@ class MainWindow(QMainWindow):
         status_layout.setContentsMargins(0, 0, 0, 0)
         
         self.status_label = QLabel("Ready")
-        self.status_label.setFont(QFont("Arial", 9))
+        self.status_label.setFont(_font(9))
         status_layout.addWidget(self.status_label)
         
         main_layout.addWidget(status_frame)
     
     def setup_training_events_tab(self):
-        """Set up the training events tab"""
-        self.training_events_tab = TrainingEventsTab()
-        self.tab_widget.addTab(self.training_events_tab, "📚 Training")
+        """Set up the training events tab (built on first view)"""
+        self.training_events_tab: Optional[TrainingEventsTab] = None
+        self._add_lazy_tab("📚 Training", 'training_events_tab', TrainingEventsTab)
     
     def setup_stat_recommendations_tab(self):
-        """Set up the stat recommendations tab"""
-        self.stat_recommendations_tab = StatRecommendationsTab()
-        self.tab_widget.addTab(self.stat_recommendations_tab, "📊 Stats")
+        """Set up the stat recommendations tab (built on first view)"""
+        self.stat_recommendations_tab: Optional[StatRecommendationsTab] = None
+        self._add_lazy_tab("📊 Stats", 'stat_recommendations_tab', StatRecommendationsTab)
+
+    def _add_lazy_tab(self, title: str, attr: str, factory):
+        """Add an empty tab whose content is created by *factory* when first shown.
+
+        Keeps the heavy data tabs from delaying the first paint of the Scanner tab.
+        """
+        holder = QWidget()
+        layout = QVBoxLayout(holder)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._lazy_tabs[holder] = (attr, factory)
+        self.tab_widget.addTab(holder, title)
+
+    def _build_lazy_tab(self, index: int):
+        """Fill a lazily created tab the first time it becomes current"""
+        holder = self.tab_widget.widget(index)
+        pending = self._lazy_tabs.pop(holder, None)
+        if pending is None:
+            return
+        attr, factory = pending
+        widget = factory()
+        setattr(self, attr, widget)
+        holder.layout().addWidget(widget)
     
     def setup_scanner_tab(self):
         """Set up the scanner tab"""
@@ -201,7 +362,7 @@ class MainWindow(QMainWindow):
         
         # Region selection group
         region_group = QGroupBox("📐 Scan Region")
-        region_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        region_group.setFont(_font(10, bold=True))
         
         region_layout = QHBoxLayout(region_group)
         region_layout.setContentsMargins(15, 15, 15, 15)
@@ -228,7 +389,7 @@ class MainWindow(QMainWindow):
         
         # Control group
         self.control_group = QGroupBox("🎮 Controls")
-        self.control_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        self.control_group.setFont(_font(10, bold=True))
         
         control_layout = QHBoxLayout(self.control_group)
         control_layout.setContentsMargins(15, 15, 15, 15)
@@ -250,7 +411,7 @@ class MainWindow(QMainWindow):
         
         # Results group
         results_group = QGroupBox("📊 Results")
-        results_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        results_group.setFont(_font(10, bold=True))
         
         results_layout = QVBoxLayout(results_group)
         results_layout.setContentsMargins(10, 15, 10, 15)
@@ -258,7 +419,7 @@ class MainWindow(QMainWindow):
         splitter = QSplitter()
         splitter.setOrientation(Qt.Orientation.Horizontal)
         splitter.setHandleWidth(2)
-        splitter.setStyleSheet("QSplitter::handle { background-color: #555; }")
+        splitter.setStyleSheet(SPLITTER_HANDLE_CSS)
         self.result_splitter = splitter
 
         # Event summary (centered labels)
@@ -269,31 +430,30 @@ class MainWindow(QMainWindow):
         self.lbl_name = QLabel()
         self.lbl_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_name.setWordWrap(True)
+        self.lbl_name.setFont(_font(SUMMARY_FONT_PT, bold=True))
         self.lbl_type = QLabel()
         self.lbl_type.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lbl_type.setFont(_font(SUMMARY_FONT_PT))
         self.lbl_owner = QLabel()
         self.lbl_owner.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.lbl_owner.setWordWrap(True)
+        self.lbl_owner.setFont(_font(SUMMARY_FONT_PT))
+        for lbl in (self.lbl_name, self.lbl_type, self.lbl_owner):
+            lbl.setTextFormat(Qt.TextFormat.RichText)
         sum_layout.addWidget(self.lbl_name)
         sum_layout.addWidget(self.lbl_type)
         sum_layout.addWidget(self.lbl_owner)
         sum_layout.addStretch(1)
         splitter.addWidget(self.summary_widget)
 
-        # Detail panel with scroll
-        self.detail_widget = QWidget()
-        detail_layout = QVBoxLayout(self.detail_widget)
-        detail_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        detail_layout.addStretch(1)
-        self.detail_layout = detail_layout  # keep for update
-        detail_layout.addStretch(1)
-
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setWidget(self.detail_widget)
-        splitter.addWidget(scroll_area)
+        # Detail panel: one rich-text document, re-rendered per event (scrolls itself)
+        self.detail_view = QTextBrowser()
+        self.detail_view.setObjectName("detailView")
+        self.detail_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.detail_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.detail_view.setOpenLinks(False)
+        self.detail_view.setFont(_font(DETAIL_FONT_PT))
+        splitter.addWidget(self.detail_view)
 
         # Hidden log text to maintain update_results without refactor
         from PyQt6.QtWidgets import QTextEdit
@@ -323,7 +483,7 @@ class MainWindow(QMainWindow):
         
         # Controls group
         controls_group = QGroupBox("📋 History Controls")
-        controls_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        controls_group.setFont(_font(10, bold=True))
         
         controls_layout = QHBoxLayout(controls_group)
         controls_layout.setContentsMargins(15, 15, 15, 15)
@@ -342,20 +502,31 @@ class MainWindow(QMainWindow):
         
         # History list group
         history_group = QGroupBox("📜 Event History")
-        history_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        history_group.setFont(_font(10, bold=True))
         
         history_layout = QVBoxLayout(history_group)
         history_layout.setContentsMargins(10, 15, 10, 15)
         
-        self.history_list = QListWidget()
-        self.history_list.setFont(QFont("Arial", 10))
-        self.history_list.itemDoubleClicked.connect(self.show_history_event)
+        # Set when history changed while the tab was hidden
+        self._history_dirty = False
+        self._history_model = HistoryModel(self)
+        self.history_list = QListView()
+        self.history_list.setModel(self._history_model)
+        self.history_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.history_list.setFont(_font(10))
+        # All rows are single-line text: one row height, and lay out large batches incrementally
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.history_list.setBatchSize(256)
+        self.history_list.doubleClicked.connect(self.show_history_event)
         history_layout.addWidget(self.history_list)
         
         tab_layout.addWidget(history_group)
         tab_layout.setStretch(1, 1)  # Make history list stretch
         
         self.tab_widget.addTab(tab, "📜 History")
+        self._history_tab = tab
+        tab.installEventFilter(self)
         
         # Initialize history display
         self.refresh_history()
@@ -368,7 +539,7 @@ class MainWindow(QMainWindow):
         
         # Scanner settings group
         scanner_group = QGroupBox("⚙️ Scanner Settings")
-        scanner_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        scanner_group.setFont(_font(10, bold=True))
         
         scanner_layout = QVBoxLayout(scanner_group)
         scanner_layout.setContentsMargins(15, 15, 15, 15)
@@ -416,7 +587,7 @@ class MainWindow(QMainWindow):
         tab_layout.addWidget(scanner_group)
 
         update_group = QGroupBox("🔄 Data Update")
-        update_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        update_group.setFont(_font(10, bold=True))
         update_layout = QHBoxLayout(update_group)
         self.update_btn = QPushButton("🔄 Update")
         self.update_btn.clicked.connect(self.on_update_data)
@@ -426,7 +597,7 @@ class MainWindow(QMainWindow):
         
         # Popup settings group
         popup_group = QGroupBox("🔔 Popup Settings")
-        popup_group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        popup_group.setFont(_font(10, bold=True))
         
         popup_layout = QVBoxLayout(popup_group)
         popup_layout.setContentsMargins(15, 15, 15, 15)
@@ -460,12 +631,7 @@ class MainWindow(QMainWindow):
         self.theme_checkbox = QCheckBox("🌙 Dark Theme")
         is_dark = (self.settings.get('theme', 'dark') == 'dark')
         self.theme_checkbox.setChecked(is_dark)
-        def _on_theme_toggle(checked):
-            self.apply_theme('dark' if checked else 'light')
-            # persist immediately
-            self.settings.set('theme', 'dark' if checked else 'light')
-            self.settings.save_settings()
-        self.theme_checkbox.toggled.connect(_on_theme_toggle)
+        self.theme_checkbox.toggled.connect(self._on_theme_toggled)
         theme_layout.addWidget(self.theme_checkbox)
         theme_layout.addStretch(1)
         popup_layout.addLayout(theme_layout)
@@ -481,17 +647,47 @@ class MainWindow(QMainWindow):
         
         self.tab_widget.addTab(tab, "⚙️ Settings")
     
+    @pyqtSlot(bool)
+    def _on_theme_toggled(self, checked: bool):
+        """Switch theme from the settings checkbox and persist it immediately"""
+        theme = 'dark' if checked else 'light'
+        self.apply_theme(theme)
+        self.settings.set('theme', theme)
+        self.settings.save_settings()
+
     def connect_signals(self):
         """Connect signals to slots"""
         self.update_results_signal.connect(self.update_results)
         self.event_detected_signal.connect(self.display_event_in_results)
+        self.history_updated_signal.connect(self.refresh_history)
+        self.interval_spinbox.valueChanged.connect(self._on_interval_changed)
+
+    @pyqtSlot(float)
+    def _on_interval_changed(self, value: float):
+        """Apply a new scan interval to the running scan loop right away"""
+        self._scan_interval = value
     
+    def _refresh_screen_geometry(self, *_):
+        """Re-read the primary screen geometry (connected to screen change signals)."""
+        screen = QApplication.primaryScreen()
+        if screen is not self._watched_screen:
+            # Follow resolution/DPI changes of whichever screen is primary now
+            if self._watched_screen is not None:
+                try:
+                    self._watched_screen.geometryChanged.disconnect(self._refresh_screen_geometry)
+                except (TypeError, RuntimeError):
+                    pass  # Already disconnected, or the screen was removed
+            if screen is not None:
+                screen.geometryChanged.connect(self._refresh_screen_geometry)
+            self._watched_screen = screen
+        self._screen_geom = screen.geometry() if screen else None
+
     def position_window(self):
         """Position the window on the screen"""
         saved = self.settings.get('window_position')
 
-        screen = QApplication.primaryScreen()
-        if not screen:
+        sg = self._screen_geom
+        if sg is None:
             return
 
         if saved and isinstance(saved, str) and 'x' in saved and '+' in saved:
@@ -501,7 +697,6 @@ class MainWindow(QMainWindow):
                 x, y = map(int, pos.split('+')) if '+' in pos else (0, 0)
 
                 # Validate within current screen bounds
-                sg = screen.geometry()
                 if 50 <= w <= sg.width() and 50 <= h <= sg.height():
                     self.resize(w, h)
                 if 0 <= x <= sg.width() - 50 and 0 <= y <= sg.height() - 50:
@@ -512,7 +707,6 @@ class MainWindow(QMainWindow):
 
         # Default position: right-top corner
         self.resize(560, self.height())
-        sg = screen.geometry()
         x = sg.width() - self.width() - 20
         y = 20
         self.move(x, y)
@@ -557,6 +751,8 @@ class MainWindow(QMainWindow):
     def on_region_selected(self, region):
         """Handle region selection"""
         self.scan_region = region
+        _, _, w, h = region
+        self._cap_bufs = [np.empty((h, w), dtype=np.uint8) for _ in range(2)]
         self.settings.set('last_region', region)
         self.settings.save_settings()
         self.region_label.setText(self.get_region_text())
@@ -572,12 +768,10 @@ class MainWindow(QMainWindow):
             x, y, w, h = self.scan_region
             
             # Validate region
-            screen = QApplication.primaryScreen()
-            if not screen:
+            screen_geometry = self._screen_geom
+            if screen_geometry is None:
                 QMessageBox.critical(self, "Error", "Could not get screen information")
                 return
-                
-            screen_geometry = screen.geometry()
             
             if x < 0 or y < 0 or x + w > screen_geometry.width() or y + h > screen_geometry.height():
                 QMessageBox.critical(
@@ -589,8 +783,20 @@ class MainWindow(QMainWindow):
                 )
                 return
             
-            # Take screenshot of the region
-            screenshot = pyautogui.screenshot(region=self.scan_region)
+            # Grab and prepare exactly as the scan loop does (same pixel space and
+            # gray/resize steps), so the preview and contrast show what OCR gets
+            sct = mss.mss() if MSS_AVAILABLE else None
+            try:
+                raw = self._grab_region(sct, {"left": x, "top": y, "width": w, "height": h})
+            finally:
+                if sct is not None:
+                    sct.close()
+            # slot=None: fresh arrays, a running scan keeps its frame buffers
+            pixels = self._prepare_frame(raw, None)
+            # copy(): the QImage must own its pixels once the temporary bytes go away
+            frame = QImage(pixels.tobytes(), pixels.shape[1], pixels.shape[0], pixels.shape[1],
+                           QImage.Format.Format_Grayscale8).copy()
+            pixmap = QPixmap.fromImage(frame)
             
             # Create a preview dialog
             from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout
@@ -604,7 +810,10 @@ class MainWindow(QMainWindow):
             # Info label with detailed coordinates
             info_text = f"Region: {x},{y} | Size: {w}x{h}\n"
             info_text += f"Screen: {screen_geometry.width()}x{screen_geometry.height()}\n"
-            info_text += f"Screenshot size: {screenshot.width}x{screenshot.height}"
+            info_text += f"Screenshot size: {raw.shape[1]}x{raw.shape[0]} (OCR input {frame.width()}x{frame.height()})\n"
+            # Helps tune BLANK_STD_THRESHOLD against the user's actual region
+            contrast = float(pixels[::8, ::8].std())
+            info_text += f"Contrast (std): {contrast:.1f} (blank below {BLANK_STD_THRESHOLD:.0f})"
             info_label = QLabel(info_text)
             info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(info_label)
@@ -613,9 +822,7 @@ class MainWindow(QMainWindow):
             img_label = QLabel()
             img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
-            # Convert PIL Image to QPixmap
-            qimg = QPixmap.fromImage(screenshot.toqimage())
-            img_label.setPixmap(qimg)
+            img_label.setPixmap(pixmap)
             
             layout.addWidget(img_label)
             
@@ -653,25 +860,27 @@ class MainWindow(QMainWindow):
             return
         
         self.scanning = True
+        self._last_frame_key = None
+        self._last_dhash = None
+        self._stable_ticks = 0
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         
         # Update UI to show active scanning state
         self.status_label.setText("🔄 Scanning active...")
-        self.status_label.setProperty("state","running")
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
+        self._set_style_state(self.status_label, "state", "running")
         
         # Change window title to indicate scanning is active
         self.setWindowTitle("Uma Event Scanner - [SCANNING ACTIVE]")
         
         # Highlight the control group to indicate active scanning
-        self.control_group.setProperty("active", True)
-        self.control_group.style().unpolish(self.control_group)
-        self.control_group.style().polish(self.control_group)
+        self._set_style_state(self.control_group, "active", True)
         
-        # Start scanning thread
-        self.scan_thread = threading.Thread(target=self.scan_loop, daemon=True)
+        # Let a previous scan thread finish first so two loops never share the capture buffer
+        if self.scan_thread is not None and self.scan_thread.isRunning():
+            self.scan_thread.wait()
+        self._scan_wake.clear()
+        self.scan_thread = ScanThread(self)
         self.scan_thread.start()
         
         Logger.info("Scanning started")
@@ -679,221 +888,337 @@ class MainWindow(QMainWindow):
     def stop_scanning(self):
         """Stop the scanning process"""
         self.scanning = False
+        if self.scan_thread is not None:
+            self.scan_thread.requestInterruption()
+        self._scan_wake.set()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
         # Update UI to show stopped state
         self.status_label.setText("⏹️ Scanning stopped")
-        self.status_label.setProperty("state","stopped")
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
+        self._set_style_state(self.status_label, "state", "stopped")
         
         # Reset window title
         self.setWindowTitle("Uma Event Scanner")
         
         # Reset control group style
-        self.control_group.setProperty("active", False)
-        self.control_group.style().unpolish(self.control_group)
-        self.control_group.style().polish(self.control_group)
+        self._set_style_state(self.control_group, "active", False)
         
         Logger.info("Scanning stopped")
+
+    @staticmethod
+    def _set_style_state(widget: QWidget, prop: str, value):
+        """Switch a QSS dynamic property and re-polish only if it changed."""
+        if widget.property(prop) == value:
+            return
+        widget.setProperty(prop, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
     
-    def scan_loop(self):
-        """Main scanning loop running in a separate thread"""
-        while self.scanning:
-            try:
-                screenshot = pyautogui.screenshot(region=self.scan_region)
-                img_array = np.array(screenshot)
-                img_array = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-                
-                # Apply image size optimization if available
-                if GPU_CONFIG_AVAILABLE:
-                    max_size = IMAGE_PROCESSING_CONFIG.get('max_image_size', (800, 600))
-                    h, w = img_array.shape[:2]
-                    if h > max_size[1] or w > max_size[0]:
-                        scale = min(max_size[0] / w, max_size[1] / h)
-                        new_w, new_h = int(w * scale), int(h * scale)
-                        img_array = cv2.resize(img_array, (new_w, new_h), interpolation=cv2.INTER_AREA)
-                
-                # Extract text
-                texts = self.ocr_engine.extract_text(img_array) if self.ocr_engine else []
-                
-                # If original didn't work well, try processed image
-                if not texts or len(''.join(texts)) < 3:
-                    processed_img = self.image_processor.preprocess_for_ocr(img_array)
-                    texts = self.ocr_engine.extract_text(processed_img) if self.ocr_engine else []
-                
-                if texts:
-                    # Emit signal to update UI in main thread
-                    self.update_results_signal.emit(texts)
+    def scan_loop(self, thread: QThread):
+        """Main scanning loop, run by *thread* (a ScanThread) until interrupted.
+
+        Capture runs here while OCR + matching run on ``self._ocr_executor``,
+        so frame N+1 is grabbed and prepared (into the other buffer slot)
+        while frame N is still being read. At most one OCR job is in flight.
+        """
+        pending = None
+        slot = 0
+        errors = 0
+        sct = None
+        try:
+            # mss handles are per-thread, so the grabber is opened by the scan thread itself
+            sct = mss.mss() if MSS_AVAILABLE else None
+            x, y, w, h = self.scan_region
+            monitor = {"left": x, "top": y, "width": w, "height": h}
+            while not thread.isInterruptionRequested():
+                try:
+                    # Grab and prepare overlap with OCR of the previous frame (other slot)
+                    raw = self._grab_region(sct, monitor)
+                    img_array = self._prepare_frame(raw, slot)
+
+                    # Hand over once the previous frame is done: one OCR job at a time
+                    if pending is not None:
+                        pending, prev = None, pending
+                        prev.result()
+                    pending = self._ocr_executor.submit(self._process_frame, img_array)
+                    slot ^= 1
+                    errors = 0
                     
-                    # Check if texts match an event, considering selected character id
-                    event = self.event_db.find_matching_event(texts, self.selected_character_id)
-                    if event:
-                        # Skip if this event was recently dismissed by the user
-                        if self.dismissed_event_name == event['name']:
-                            # Still update last_event_name to current event for future comparison
-                            self.last_event_name = event['name']
-                            # Do not show the popup again until the event disappears
-                        else:
-                            # Only emit if new or changed event
-                            if event['name'] != self.last_event_name:
-                                self.last_event_name = event['name']
-                            # update source frequency
-                            for src in event.get('sources', []):
-                                src_name = src.get('name')
-                                if src_name:
-                                    self.event_db.increment_source(src_name)
-                            self.event_detected_signal.emit(event)
-                            # Add to history
-                            self.history.add_entry(event, texts)
-                            Logger.info(f"Event detected: {event['name']}")
-                    else:
-                        # No matching event detected – close existing popup if needed
-                        if self.last_event_name is not None or self.current_popup:
-                            self.last_event_name = None
-                            self.dismissed_event_name = None
-                            self.event_detected_signal.emit(None)
+                    backoff = min(SCAN_BACKOFF_MAX, 1 + self._stable_ticks // SCAN_BACKOFF_STEP)
+                    self._scan_wake.wait(self._scan_interval * backoff)
+                    
+                except Exception as e:
+                    Logger.error(f"Scan error: {e}")
+                    # Retry transient failures quickly, persistent ones at the normal cadence
+                    errors += 1
+                    delay = min(self._scan_interval, SCAN_ERROR_RETRY * 2 ** (errors - 1))
+                    self._scan_wake.wait(delay)
+        finally:
+            # The in-flight job still reads a frame buffer: let it finish before a new
+            # loop (or shutdown) can reuse the buffers
+            if pending is not None:
+                try:
+                    pending.result()
+                except Exception as e:
+                    Logger.error(f"Scan error: {e}")
+            if sct is not None:
+                sct.close()
+
+    def _grab_region(self, sct, monitor: Dict) -> np.ndarray:
+        """Grab the scan region: BGRA via mss when available, otherwise RGB via pyautogui."""
+        if sct is not None:
+            shot = sct.grab(monitor)
+            return np.frombuffer(shot.bgra, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        screenshot = pyautogui.screenshot(region=self.scan_region)
+        return np.asarray(screenshot)
+
+    def _prepare_frame(self, raw: np.ndarray, slot: Optional[int]) -> np.ndarray:
+        """Turn a grabbed frame into a grayscale OCR input and cap its size.
+
+        EasyOCR reduces to gray internally anyway, so converting once here
+        means hashing, the blank gate, resizing and OCR all read a third of
+        the bytes. The returned array may be one of *slot*'s reusable buffers,
+        so the caller must not prepare into a slot whose frame is still being
+        read. ``slot=None`` allocates fresh arrays instead (region preview).
+        """
+        # mss frames are BGRA, pyautogui frames are RGB
+        code = cv2.COLOR_BGRA2GRAY if raw.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+        shape = raw.shape[:2]
+        buf = None
+        if slot is not None:
+            buf = self._cap_bufs[slot]
+            if buf is None or buf.shape != shape:
+                buf = self._cap_bufs[slot] = np.empty(shape, dtype=np.uint8)
+        img_array = cv2.cvtColor(raw, code, dst=buf)
+        
+        # Apply image size optimization if available
+        if GPU_CONFIG_AVAILABLE:
+            max_size = IMAGE_PROCESSING_CONFIG.get('max_image_size', (800, 600))
+            h, w = img_array.shape[:2]
+            if h > max_size[1] or w > max_size[0]:
+                scale = min(max_size[0] / w, max_size[1] / h)
+                new_w, new_h = int(w * scale), int(h * scale)
+                # Mild shrinks don't alias: bilinear is a few times cheaper than area averaging
+                interp = cv2.INTER_LINEAR if scale > 0.5 else cv2.INTER_AREA
+                shape = (new_h, new_w)
+                buf = None
+                if slot is not None:
+                    buf = self._resize_bufs[slot]
+                    if buf is None or buf.shape != shape:
+                        buf = self._resize_bufs[slot] = np.empty(shape, dtype=np.uint8)
+                img_array = cv2.resize(img_array, (new_w, new_h), dst=buf, interpolation=interp)
+        return img_array
+
+    def _process_frame(self, img_array: np.ndarray):
+        """OCR a captured frame and emit the detection result (OCR worker thread)."""
+        if self._is_blank_frame(img_array):
+            # Near-uniform region (no dialog on screen) – skip OCR entirely
+            texts = []
+            self._last_frame_key = None
+            self._last_dhash = None
+            self._stable_ticks = 0
+        else:
+            frame_key = self.image_processor.frame_hash(img_array)
+            if frame_key == self._last_frame_key:
+                # Pixel-identical to the previous frame: its result is already shown
+                self._stable_ticks += 1
+                return
+            self._last_frame_key = frame_key
+            # Animated-but-unchanged screens keep backing off; real changes reset it.
+            # OCR still runs on such frames, so a new event is never skipped.
+            dhash = self.image_processor.dhash(img_array)
+            prev_dhash, self._last_dhash = self._last_dhash, dhash
+            if prev_dhash is not None and self.image_processor.hamming(dhash, prev_dhash) <= DHASH_JITTER_BITS:
+                self._stable_ticks += 1
+            else:
+                self._stable_ticks = 0
+            texts = self._ocr_cache.get(frame_key)
+            if texts is None:
+                texts = self._run_ocr(img_array)
+                self._ocr_cache.put(frame_key, texts)
+        
+        if texts:
+            # Emit signal to update UI in main thread
+            self.update_results_signal.emit(texts)
+            
+            # Check if texts match an event, considering selected character id
+            event = self._match_event(texts)
+            if event:
+                # Skip if this event was recently dismissed by the user
+                if self.dismissed_event_name == event['name']:
+                    # Still update last_event_name to current event for future comparison
+                    self.last_event_name = event['name']
+                    # Do not show the popup again until the event disappears
                 else:
-                    # No OCR text at all – ensure popup is closed
-                    if self.last_event_name is not None or self.current_popup:
-                        self.last_event_name = None
-                        self.dismissed_event_name = None
-                        self.event_detected_signal.emit(None)
-                
-                # Get scan interval from settings
-                interval = float(self.settings.get('scan_interval', 2.0) or 2.0)
-                time.sleep(interval)
-                
-            except Exception as e:
-                Logger.error(f"Scan error: {e}")
-                time.sleep(1)
+                    # Only emit if new or changed event
+                    if event['name'] != self.last_event_name:
+                        self.last_event_name = event['name']
+                        # Log once per appearance, not on every scan tick it stays on screen
+                        Logger.info(f"Event detected: {event['name']}")
+                    # update source frequency (one Counter update per event)
+                    self.event_db.increment_sources(
+                        src['name'] for src in event.get('sources', []) if src.get('name'))
+                    self._emit_event_state(event)
+                    # Add to history
+                    self.history.add_entry(event, texts)
+                    self.history_updated_signal.emit()
+            else:
+                # No matching event detected – reset state, emit only on transition
+                self.last_event_name = None
+                self.dismissed_event_name = None
+                self._emit_event_state(None)
+        else:
+            # No OCR text at all – reset state, emit only on transition
+            self.last_event_name = None
+            self.dismissed_event_name = None
+            self._emit_event_state(None)
     
+    def _match_event(self, texts: List[str]) -> Optional[Dict]:
+        """Memoised find_matching_event keyed by normalised OCR text + character."""
+        key = (" ".join(texts).lower().strip(), self.selected_character_id)
+        cache = self._match_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        event = self.event_db.find_matching_event(texts, self.selected_character_id)
+        cache[key] = event
+        if len(cache) > MATCH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return event
+
+    def _reset_match_cache(self):
+        """Drop memoised matches (GUI thread).
+
+        The dict is swapped rather than cleared so a lookup in flight on the
+        OCR worker keeps working on the old one.
+        """
+        self._match_cache = OrderedDict()
+
+    def _run_ocr(self, img_array: np.ndarray) -> List[str]:
+        """Run OCR on a frame.
+
+        OCREngine.extract_text already retries on the preprocessed image when
+        the raw pass reads too little, so no second fallback is done here.
+        """
+        return self.ocr_engine.extract_text(img_array) if self.ocr_engine else []
+
+    @staticmethod
+    def _is_blank_frame(img_array: np.ndarray) -> bool:
+        """Cheap blank-frame gate: std-dev of a 1/64 pixel subsample."""
+        return float(img_array[::8, ::8].std()) < BLANK_STD_THRESHOLD
+
+    def _emit_event_state(self, event: Optional[Dict]):
+        """Emit event_detected_signal only when the detected event changes.
+
+        Repeated detections of the same event (or repeated "no event" frames)
+        are dropped so the main thread is not flooded with queued signals.
+        """
+        # Identity, not name: same-name variants (other owner/character) must re-render
+        if event is self._last_emitted_event:
+            return
+        self.event_detected_signal.emit(event)
+        self._last_emitted_event = event
+
+    @pyqtSlot(list)
     def update_results(self, texts: List[str]):
         """Update results display (called in main thread)"""
-        self.result_text.clear()
-        
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.result_text.append(f"=== {timestamp} ===")
-        self.result_text.append(f"Detected {len(texts)} text(s):\n")
-        
-        for i, text in enumerate(texts, 1):
-            self.result_text.append(f"[{i}] {text}")
+        # Build the whole block first: one setPlainText = one document layout pass
+        lines = [f"=== {self._clock()} ===", f"Detected {len(texts)} text(s):\n"]
+        lines.extend(f"[{i}] {text}" for i, text in enumerate(texts, 1))
+        self.result_text.setPlainText("\n".join(lines))
     
+    def _clock(self) -> str:
+        """Current time as HH:MM:SS, formatted at most once per second"""
+        now = time.time()
+        sec = int(now)
+        if sec != self._clock_sec:
+            self._clock_sec = sec
+            self._clock_str = time.strftime('%H:%M:%S', time.localtime(now))
+        return self._clock_str
+
+    @pyqtSlot(object)
     def display_event_in_results(self, event):
         """Append event details to result_text viewer."""
         if event is None:
             self.result_text.append("No event matched.\n")
             return
 
+        # Same event re-detected under the same filter: panels are already up to date
+        render_key = (event.get('name'), id(event), self.selected_character_id)
+        if render_key == self._last_rendered_key:
+            return
+
         # No skipping here – database already preferred variant; just show
 
-        src_list = event.get('sources', []) or []
-        match_selected = False
-        if self.selected_character_id:
-            match_selected = any(str(s.get('id')) == self.selected_character_id for s in src_list)
+        source_ids = event.get('_source_ids')
+        if source_ids is None:
+            # Events restored from an older history file lack the precomputed fields
+            src_list = event.get('sources', []) or []
+            source_ids = frozenset(str(s.get('id')) for s in src_list if s.get('id') is not None)
+            owners = ", ".join(s.get('name','') for s in src_list if s.get('name')) or "?"
+        else:
+            owners = event['_owners']
 
-        if match_selected:
+        if self.selected_character_id and self.selected_character_id in source_ids:
             owners = self.selected_character_name or "?"
-        else:
-            owners = ", ".join(s.get('name','') for s in src_list if s.get('name')) or "?"
 
         # Do not skip on name mismatch; database already handled preference
 
-        # Apply colored, larger text for summary labels
-        self.lbl_name.setText(
-            f"<span style='color:{SUMMARY_NAME_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><b>{event.get('name','Unknown')}</b></span>"
-        )
-        self.lbl_name.setTextFormat(Qt.TextFormat.RichText)
-        self.lbl_name.setFont(QFont('Arial', SUMMARY_FONT_PT, QFont.Weight.Bold))
-
-        self.lbl_type.setText(
-            f"<span style='color:{SUMMARY_TYPE_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><i>{event.get('type','')}</i></span>"
-        )
-        self.lbl_type.setTextFormat(Qt.TextFormat.RichText)
-        self.lbl_type.setFont(QFont('Arial', SUMMARY_FONT_PT))
-
-        self.lbl_owner.setText(
-            f"<span style='color:{SUMMARY_OWNER_COLOR}; font-size:{SUMMARY_FONT_PT}pt;'><b>{owners}</b></span>"
-        )
-        self.lbl_owner.setTextFormat(Qt.TextFormat.RichText)
-        self.lbl_owner.setFont(QFont('Arial', SUMMARY_FONT_PT))
+        # Apply colored, larger text for summary labels (fonts/format set once in setup)
+        self.lbl_name.setText(SUMMARY_NAME_HTML.format(event.get('name','Unknown')))
+        self.lbl_type.setText(SUMMARY_TYPE_HTML.format(event.get('type','')))
+        self.lbl_owner.setText(SUMMARY_OWNER_HTML.format(owners))
 
         self.show_event_details(event)
+        self._last_rendered_key = render_key
 
     def on_event_item_clicked(self, *args):
         return
 
     def show_event_details(self, event: dict):
-        # Clear previous detail
-        # remove all widgets between stretches (index 1 .. count-2)
-        while self.detail_layout.count() > 2:
-            item = self.detail_layout.takeAt(1)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Build labels
-        choices = event.get('choices',[])
-        if choices:
-            for idx, ch in enumerate(choices):
-                lbl_choice = QLabel(f"<b>{ch.get('choice','')}</b>")
-                lbl_choice.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                lbl_choice.setWordWrap(True)
-                lbl_choice.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                lbl_choice.setTextFormat(Qt.TextFormat.RichText)
-                lbl_choice.setFont(QFont("Arial", DETAIL_FONT_PT, QFont.Weight.Bold))
-                self.detail_layout.insertWidget(self.detail_layout.count()-1, lbl_choice)
-
-                for seg in ch.get('effects', []):
-                    raw_text = seg.get('raw', '')
-                    color = None
-                    kind_raw = str(seg.get('kind', '')).lower()
-                    if kind_raw == 'stat':
-                        stat_name = seg.get('stat', '')
-                        if 'bond' in stat_name.lower():
-                            color = EFFECT_COLORS['bond']
-                        else:
-                            color = STAT_COLORS.get(stat_name)
-                    elif 'skill' in kind_raw:
-                        color = EFFECT_COLORS['skill']
-                    elif 'bond' in kind_raw:
+        """Render the choices and effects of *event* into the detail panel"""
+        cached = self._detail_html_cache.get(id(event))
+        if cached is None or cached[0] is not event:
+            # Keep the event alive with its HTML so the id cannot be reused
+            cached = (event, self._event_detail_html(event))
+            self._detail_html_cache[id(event)] = cached
+        self.detail_view.setHtml(cached[1])
+
+    @staticmethod
+    def _event_detail_html(event: dict) -> str:
+        """Build the detail panel HTML: one centred paragraph per choice/effect line"""
+        parts = []
+        choices = event.get('choices', [])
+        for idx, ch in enumerate(choices):
+            parts.append(f"<p align='center' style='font-size:{DETAIL_FONT_PT}pt;'><b>{ch.get('choice','')}</b></p>")
+
+            for seg in ch.get('effects', []):
+                raw_text = seg.get('raw', '')
+                rule, with_detail = _effect_rule(str(seg.get('kind', '')))
+                if rule == 'stat':
+                    stat_name = seg.get('stat', '')
+                    if 'bond' in stat_name.lower():
                         color = EFFECT_COLORS['bond']
-                    elif kind_raw == 'status':
-                        color = EFFECT_COLORS['status']
-                    if color:
-                        html = f"<span style='color:{color}; font-size:{DETAIL_FONT_PT}pt;'>{raw_text}</span>"
                     else:
-                        html = f"<span style='font-size:{DETAIL_FONT_PT}pt;'>{raw_text}</span>"
-                    eff = QLabel(html)
-                    eff.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                    eff.setWordWrap(True)
-                    eff.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    eff.setTextFormat(Qt.TextFormat.RichText)
-                    eff.setFont(QFont("Arial", DETAIL_FONT_PT))
-                    self.detail_layout.insertWidget(self.detail_layout.count()-1, eff)
-
-                    # Show detail under skill/status
-                    if kind_raw in {"skill", "status"} and seg.get("detail"):
-                        det = seg["detail"].get("effect") or ", ".join(str(v) for v in seg["detail"].values())
-                        det_html = f"<span style='color:#95A5A6; font-style:italic; font-size:{DETAIL_FONT_PT - 1}pt;'>{det}</span>"
-                        det_lbl = QLabel(det_html)
-                        det_lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                        det_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        det_lbl.setTextFormat(Qt.TextFormat.RichText)
-                        det_lbl.setWordWrap(True)
-                        det_font = QFont("Arial", DETAIL_FONT_PT - 1)
-                        det_font.setItalic(True)
-                        det_lbl.setFont(det_font)
-                        self.detail_layout.insertWidget(self.detail_layout.count()-1, det_lbl)
-
-                # Insert separator between choices (except after last)
-                if idx < len(choices) - 1:
-                    sep = QLabel("<span style='color:#666;'>──────────────</span>")
-                    sep.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-                    sep.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    sep.setTextFormat(Qt.TextFormat.RichText)
-                    sep.setFont(QFont("Arial", DETAIL_FONT_PT))
-                    self.detail_layout.insertWidget(self.detail_layout.count()-1, sep)
+                        color = STAT_COLORS.get(stat_name)
+                else:
+                    color = EFFECT_COLORS[rule] if rule else None
+                color_css = f"color:{color}; " if color else ""
+                parts.append(f"<p align='center' style='{color_css}font-size:{DETAIL_FONT_PT}pt;'>{raw_text}</p>")
+
+                # Show detail under skill/status
+                if with_detail and seg.get("detail"):
+                    det = seg["detail"].get("effect") or ", ".join(str(v) for v in seg["detail"].values())
+                    parts.append(
+                        f"<p align='center' style='color:#95A5A6; font-style:italic; "
+                        f"font-size:{DETAIL_FONT_PT - 1}pt;'>{det}</p>"
+                    )
+
+            # Separator between choices (except after last)
+            if idx < len(choices) - 1:
+                parts.append("<p align='center' style='color:#666;'>──────────────</p>")
+        return "".join(parts)
 
     # Event popup removed – no-op
     def show_event_popup(self, *args, **kwargs):
@@ -901,8 +1226,9 @@ class MainWindow(QMainWindow):
     
     def ensure_popup_visible(self):
         """Make sure popup is visible"""
-        if self.current_popup and hasattr(self.current_popup, 'ensure_visible'):
-            self.current_popup.ensure_visible()
+        popup = self.current_popup
+        if popup is not None:
+            popup.ensure_visible()
         else:
             Logger.debug("Cannot ensure popup visibility - popup not available")
     
@@ -911,76 +1237,102 @@ class MainWindow(QMainWindow):
         self.current_popup = None
         # Remember which event was dismissed so we don't reopen it immediately
         self.dismissed_event_name = self.last_event_name
-        # Make sure main window gets focus back
-        self.activateWindow()
+        # Make sure main window gets focus back once the popup is gone
         self.raise_()
-        QApplication.processEvents()
+        QTimer.singleShot(0, self.activateWindow)
         Logger.debug("Popup was closed, main window focus restored")
     
+    @pyqtSlot()
     def refresh_history(self):
-        """Refresh history display"""
-        self.history_list.clear()
-        
-        for entry in self.history.get_history():
-            timestamp = entry['timestamp'].strftime('%H:%M:%S')
-            event_name = entry['event']['name']
-            self.history_list.addItem(f"{timestamp} - {event_name}")
+        """Refresh history display, adding only entries that are not shown yet"""
+        if not self.history_list.isVisible():
+            # Nobody is looking – catch up when the History tab is shown
+            self._history_dirty = True
+            return
+        self._history_dirty = False
+        # The model inserts only entries it does not hold yet
+        self._history_model.sync(self.history.get_history())
+
+    def reset_history_view(self, entries: Optional[List[Dict]] = None):
+        """Rebuild the whole history list from *entries* (default: current history)"""
+        if entries is None:
+            entries = self.history.get_history()
+        self._history_model.reset(entries)
     
+    def eventFilter(self, obj, event):
+        """Flush deferred history updates when the History tab becomes visible"""
+        if obj is self._history_tab and event.type() == QEvent.Type.Show and self._history_dirty:
+            self.refresh_history()
+        return super().eventFilter(obj, event)
+
     def clear_history(self):
-        """Clear all history"""
-        reply = QMessageBox.question(
-            self, "Confirm", "Clear all history?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+        """Ask to clear all history (window-modal; the scan keeps running meanwhile)"""
+        box = QMessageBox(
+            QMessageBox.Icon.Question, "Confirm", "Clear all history?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            self.history.clear()
-            self.refresh_history()
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def on_clicked(button):
+            if box.standardButton(button) == QMessageBox.StandardButton.Yes:
+                self._clear_history_confirmed()
+
+        box.buttonClicked.connect(on_clicked)
+        box.open()
+
+    def _clear_history_confirmed(self):
+        """Drop all history entries and empty the list in one model reset"""
+        self.history.clear()
+        self.reset_history_view([])
+        self._history_dirty = False
     
-    def show_history_event(self, item):
+    def show_history_event(self, index):
         """Show event details when double-clicking on history item"""
-        index = self.history_list.currentRow()
-        history_entries = self.history.get_history()
+        entry = self._history_model.entry(index.row()) if index.isValid() else None
         
-        if 0 <= index < len(history_entries):
-            entry = history_entries[index]
+        if entry:
             event_data = entry['event']
             
             # Display event in panels instead of popup
             self.display_event_in_results(event_data)
-            owners = ", ".join(s.get('name','') for s in event_data.get('sources', []) if s.get('name')) or "?"
+            owners = event_data.get('_owners') or ", ".join(
+                s.get('name','') for s in event_data.get('sources', []) if s.get('name')) or "?"
             self.lbl_name.setText(f"<b>{event_data.get('name','Unknown')}</b>")
             self.lbl_type.setText(f"<i>{event_data.get('type','')}</i>")
             self.lbl_owner.setText(f"<b>{owners}</b>")
+            # Labels now use the history styling; let the next detection redraw them
+            self._last_rendered_key = None
+            self._last_emitted_event = _NOTHING_EMITTED
     
     def clear_last_event(self):
         """Clear the last event name and any dismissed event name, closing any current popup."""
         self.last_event_name = None
         self.dismissed_event_name = None
+        self._last_rendered_key = None
         # No popup now – nothing to close
         Logger.info("Last event name and dismissed event name cleared.")
     
     def save_settings(self):
         """Save application settings"""
+        # Compare against the stored flag: only a user change warrants an OCR reload
+        gpu_changed = bool(self.settings.get('use_gpu', False)) != self.gpu_checkbox.isChecked()
         self.settings.set('scan_interval', self.interval_spinbox.value())
         self.settings.set('auto_close_popup', self.auto_close_checkbox.isChecked())
         self.settings.set('match_threshold', self.threshold_spinbox.value())
         self.settings.set('popup_timeout', self.timeout_spinbox.value())
         self.settings.set('use_gpu', self.gpu_checkbox.isChecked())
 
-        # Apply threshold immediately
-        from event_scanner.core.event_database import EventDatabase
-        EventDatabase.THRESHOLD_SCORE = self.threshold_spinbox.value()
-        
-        # Reinitialize OCR engine if GPU flag changed
-        previous_gpu = getattr(self.ocr_engine, 'gpu', None) if self.ocr_engine else None
-        new_gpu = self.gpu_checkbox.isChecked()
+        # Apply threshold immediately; cached matches were decided under the old one
+        if EventDatabase.THRESHOLD_SCORE != self.threshold_spinbox.value():
+            EventDatabase.THRESHOLD_SCORE = self.threshold_spinbox.value()
+            self._reset_match_cache()
+
 
         if self.settings.save_settings():
             QMessageBox.information(self, "Success", "Settings saved!")
-            # Re-init OCR if GPU setting changed
-            if previous_gpu != new_gpu:
+            # Re-init OCR (slow model load) only if the GPU setting changed
+            if gpu_changed:
                 if self.scanning:
                     self.stop_scanning()
                 self.init_ocr()
@@ -1020,10 +1372,22 @@ class MainWindow(QMainWindow):
             try:
                 cmd_list = [node_cmd, cmd_path]
                 work_dir = pathlib.Path(sys.executable).parent if getattr(sys, "frozen", False) else get_base_dir()
-                proc = subprocess.Popen(cmd_list, cwd=str(work_dir), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace")
+                proc = subprocess.Popen(cmd_list, cwd=str(work_dir), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
                 if proc.stdout:
-                    for line in proc.stdout:
-                        dialog.append_signal.emit(line.rstrip())
+                    # read1 returns whatever the pipe has: forward each read's complete
+                    # lines as one queued signal, right away
+                    tail = b""
+                    while True:
+                        chunk = proc.stdout.read1(UPDATE_READ_CHUNK)
+                        if not chunk:
+                            break
+                        lines = (tail + chunk).split(b"\n")
+                        tail = lines.pop()
+                        if lines:
+                            dialog.append_signal.emit(
+                                "\n".join(line.decode("utf-8", "replace").rstrip() for line in lines))
+                    if tail:
+                        dialog.append_signal.emit(tail.decode("utf-8", "replace").rstrip())
                 proc.wait()
                 dialog.append_signal.emit(f"{name} scraping completed with exit code {proc.returncode}\n")
             except Exception as e:
@@ -1038,6 +1402,13 @@ class MainWindow(QMainWindow):
         """Handle application closing"""
         if self.scanning:
             self.stop_scanning()
+        if self.scan_thread is not None:
+            # A running QThread must not outlive its wrapper; returns within one OCR pass
+            self.scan_thread.wait()
+        # No OCR job may still emit signals or write the cache once the window and cache close
+        self._ocr_executor.shutdown(wait=True, cancel_futures=True)
+        if self.training_events_tab is not None:
+            self.training_events_tab.stop_loading()
         
         window_geometry = f"{self.width()}x{self.height()}+{self.x()}+{self.y()}"
         self.settings.set('window_position', window_geometry)
@@ -1046,21 +1417,26 @@ class MainWindow(QMainWindow):
             self.settings.set('splitter_sizes', self.result_splitter.sizes())
         except Exception:
             pass
-        self.settings.save_settings()
+        # Write to disk off the GUI thread so the window closes immediately.
+        # Non-daemon: the interpreter waits for it at exit, so the files are not truncated.
+        threading.Thread(target=self._persist_on_exit, name="save-on-exit").start()
         
         event.accept()
 
+    def _persist_on_exit(self):
+        """Flush the OCR cache and write settings (runs on a worker thread at exit)"""
+        self._ocr_cache.close()
+        self.settings.save_settings()
+
     # ---------------- Theme helper ----------------
     def apply_theme(self, theme_name: str):
         """Load stylesheet by theme name ('dark' or 'light')."""
-        import os
+        # setStyleSheet re-polishes every widget: skip it when nothing changes
+        if theme_name == self._current_theme:
+            return
+        self._current_theme = theme_name
         file_name = 'style.qss' if theme_name == 'dark' else 'style_light.qss'
-        qss_path = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'resources', file_name))
-        if os.path.exists(qss_path):
-            with open(qss_path, 'r', encoding='utf-8') as fh:
-                QApplication.instance().setStyleSheet(fh.read())
-        else:
-            QApplication.instance().setStyleSheet("")
+        QApplication.instance().setStyleSheet(_load_qss(file_name))
 
         # Update status color for current theme
         global EFFECT_COLORS
@@ -1068,6 +1444,9 @@ class MainWindow(QMainWindow):
             EFFECT_COLORS['status'] = '#9B59B6'  # Lavender-dark
         else:
             EFFECT_COLORS['status'] = '#5D8AA8'  # Steel blue-light
+        # Rendered colours depend on the theme
+        self._last_rendered_key = None
+        self._detail_html_cache.clear()
 
     def choose_character(self):
         """Open dialog to select character filter."""
@@ -1075,6 +1454,12 @@ class MainWindow(QMainWindow):
         if not char:
             return
 
+        # Force the next detection to re-render with the new filter applied
+        self._last_emitted_event = _NOTHING_EMITTED
+        self._last_frame_key = None
+        # Entries for the previous filter can no longer be hit
+        self._reset_match_cache()
+
         if char.get("clear"):
             # Clear filter
             self.selected_character_name = None
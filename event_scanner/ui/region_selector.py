@@ -68,9 +68,11 @@ class SimpleRegionSelector(QDialog):
     def paintEvent(self, event):
         """Paint the overlay and selection rectangle"""
         painter = QPainter(self)
+        # Only the damaged area is repainted (mouse moves invalidate just the selection)
+        painter.setClipRect(event.rect())
         
-        # Semi-transparent dark overlay over the entire screen
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 80))
+        # Semi-transparent dark overlay over the damaged part of the screen
+        painter.fillRect(event.rect(), QColor(0, 0, 0, 80))
         
         # Draw selection rectangle if we're selecting
         if self.is_selecting and self.start_point and self.current_point:
@@ -106,9 +108,19 @@ class SimpleRegionSelector(QDialog):
     def mouseMoveEvent(self, event):
         """Handle mouse movement to update selection"""
         if self.is_selecting:
+            old_area = self._selection_area()
             self.current_point = event.pos()
-            self.update()
+            # Repaint only where the old and new selection (border + size label) were
+            self.update(old_area.united(self._selection_area()))
     
+    def _selection_area(self) -> QRect:
+        """Screen area covered by the current selection's border and size label"""
+        if not self.start_point or not self.current_point:
+            return QRect()
+        sel = QRect(self.start_point, self.current_point).normalized()
+        label = QRect(sel.x(), sel.y() - 25, 150, 20)
+        return sel.adjusted(-4, -4, 4, 4).united(label.adjusted(-1, -1, 1, 1))
+
     def mouseReleaseEvent(self, event):
         """Handle mouse release to finalize selection"""
         if event.button() == Qt.MouseButton.LeftButton and self.is_selecting:
@@ -173,12 +185,11 @@ class RegionSelector:
             dialog = SimpleRegionSelector(self._on_region_selected)
             result = dialog.exec()
             
-            # Ensure the parent window is properly shown
+            # Bring the parent window back once, whether the selection was made or cancelled
             if self.parent:
                 self.parent.show()
                 self.parent.activateWindow()
                 self.parent.raise_()
-                QApplication.processEvents()
             
         except Exception as e:
             Logger.error(f"Failed to create region selector: {e}")
@@ -192,12 +203,6 @@ class RegionSelector:
         """Handle region selection"""
         self.region = region
         
-        if self.parent:
-            # Show parent window again
-            self.parent.show()
-            self.parent.activateWindow()
-            self.parent.raise_()
-        
         # Call the callback function
         if self.callback:
             self.callback(region)
@@ -3,19 +3,184 @@ Stat Recommendations Tab for Uma Event Scanner
 Displays recommended stats for different race types
 """
 
+import hashlib
 import json
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Mapping, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QScrollArea, QGroupBox, QGridLayout, QTabWidget
+    QScrollArea, QGroupBox, QTabWidget, QSizePolicy
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPalette, QColor
+from PyQt6.QtCore import Qt, QObject, QRect, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QPalette, QColor, QPainter
+
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 from event_scanner.utils import Logger
 from event_scanner.utils.paths import get_data_dir
 
+# Stat colors and icons with softer colors
+_STAT_CONFIGS = {
+    'SPD': {'color': '#dc3545', 'icon': '🏃', 'name': 'Speed'},
+    'STA': {'color': '#28a745', 'icon': '💚', 'name': 'Stamina'},
+    'PWR': {'color': '#fd7e14', 'icon': '💪', 'name': 'Power'},
+    'WIT': {'color': '#6f42c1', 'icon': '🧠', 'name': 'Wisdom'}
+}
+# (code, paint colour, label text) per stat in display order, built once
+_STAT_ROWS: Tuple[Tuple[str, QColor, str], ...] = tuple(
+    (code, QColor(c['color']), f"{c['icon']} {c['name']}") for code, c in _STAT_CONFIGS.items()
+)
+
+_RACE_TIPS = {
+    "Sprint/Mile": "Focus on Speed and Power. Stamina is less critical for short races.",
+    "Medium": "Balanced approach with emphasis on Speed and Stamina. Power helps with acceleration.",
+    "Long": "Stamina is crucial. Speed and Power are still important but Stamina should be prioritized."
+}
+
+# Consolidated tab stylesheet (object-name selectors), parsed once per tab
+_QSS_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'resources', 'stat_recommendations.qss'))
+
+
+@lru_cache(maxsize=None)
+def _load_qss() -> str:
+    """Read the tab stylesheet once ('' if missing)"""
+    if not os.path.exists(_QSS_PATH):
+        return ""
+    with open(_QSS_PATH, 'r', encoding='utf-8') as fh:
+        return fh.read()
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared Arial font (built on first use, after QApplication exists)"""
+    return QFont("Arial", point_size, QFont.Weight.Bold if bold else QFont.Weight.Normal)
+
+
+# Last parsed recommendations file: {'key': (path, mtime_ns, size), 'digest': bytes, 'data': dict}
+_CACHE: Dict[str, Any] = {}
+
+
+def _digest(raw: bytes) -> bytes:
+    """Content digest of the recommendations JSON (also baked in by the generator)"""
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _read_recommendations(file_path: str) -> Dict:
+    """Parse *file_path*, reusing the previous result while the file is unchanged.
+
+    A file that was rewritten with identical content returns the same dict
+    object too, so callers can skip rebuilding on an identity check.
+    """
+    st = os.stat(file_path)
+    key = (file_path, st.st_mtime_ns, st.st_size)
+    if _CACHE.get('key') == key:
+        return _CACHE['data']
+    raw = Path(file_path).read_bytes()
+    digest = _digest(raw)
+    _CACHE['key'] = key
+    if _CACHE.get('digest') != digest:
+        _CACHE['digest'] = digest
+        _CACHE['data'] = _loads(raw)
+    return _CACHE['data']
+
+
+def _baked_recommendations(file_path: str) -> Optional[Mapping]:
+    """Recommendations bundled by tools/gen_stat_recommendations.py, if still current.
+
+    Returns None when the module was not generated or *file_path*'s content
+    differs from what it was generated from, in which case the JSON file is the
+    source of truth. Keyed on content, not mtime, so copies/checkouts still match.
+    """
+    try:
+        from event_scanner.config.stat_recommendations_data import DATA, SOURCE_DIGEST
+    except ImportError:
+        return None
+    try:
+        raw = Path(file_path).read_bytes()
+    except OSError:
+        return DATA  # No JSON next to the app: the bundled copy is all we have
+    return DATA if _digest(raw).hex() == SOURCE_DIGEST else None
+
+
+class _LoaderSignals(QObject):
+    """Signals of _Loader (QRunnable is not a QObject)"""
+    # (load token, data) – object, not dict: keeps the cached dict's identity
+    loaded = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _Loader(QRunnable):
+    """Read and parse the recommendations file on a thread-pool thread"""
+
+    def __init__(self, file_path: str, token: int):
+        super().__init__()
+        self.file_path = file_path
+        self.token = token
+        self.signals = _LoaderSignals()
+
+    def run(self):
+        try:
+            self.signals.loaded.emit(self.token, _read_recommendations(self.file_path))
+        except Exception as e:
+            self.signals.failed.emit(self.token, str(e))
+
+
+class StatsCanvas(QWidget):
+    """Stat names and coloured value pills painted on one widget (no label grid)"""
+
+    ROW_H = 38
+    ROW_GAP = 12
+
+    def __init__(self, stats: Dict[str, str], parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.set_stats(stats)
+
+    def set_stats(self, stats: Dict[str, str]):
+        """Show *stats*, repainting in place"""
+        rows = [(color, label, str(stats[code])) for code, color, label in _STAT_ROWS if code in stats]
+        resized = len(rows) != len(self._rows)
+        self._rows = rows
+        if resized:
+            self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        rows = len(self._rows)
+        return QSize(300, max(0, rows * self.ROW_H + (rows - 1) * self.ROW_GAP))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        name_w = (self.width() - self.ROW_GAP) // 2
+        value_x = name_w + self.ROW_GAP
+        value_w = self.width() - value_x
+
+        for i, (color, label, value) in enumerate(self._rows):
+            y = i * (self.ROW_H + self.ROW_GAP)
+
+            # Stat icon and name
+            painter.setFont(_font(12, bold=True))
+            painter.setPen(color)
+            painter.drawText(QRect(0, y, name_w, self.ROW_H),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+
+            # Stat value on a rounded pill
+            pill = QRect(value_x, y, value_w, self.ROW_H)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(pill, 6, 6)
+            painter.setFont(_font(13, bold=True))
+            painter.setPen(Qt.GlobalColor.white)
+            painter.drawText(pill, Qt.AlignmentFlag.AlignCenter, value)
+
 
 class StatRecommendationsTab(QWidget):
     """Tab for displaying stat recommendations"""
@@ -23,108 +188,133 @@ class StatRecommendationsTab(QWidget):
     def __init__(self):
         super().__init__()
         self.recommendations_data = {}
+        self._loader = None
+        # Bumped per load; results of superseded loads are dropped
+        self._load_token = 0
+        self._refresh_pending = False
+        # Race type -> its tab / stats canvas, reused across reloads
+        self._tabs: Dict[str, QWidget] = {}
+        self._canvases: Dict[str, "StatsCanvas"] = {}
+        # Race tabs whose contents are built the first time they are shown
+        self._pending_tabs: Dict[QWidget, Tuple[str, Dict[str, str]]] = {}
         self.setup_ui()
         self.load_recommendations()
     
     def setup_ui(self):
         """Set up the user interface"""
+        self.setStyleSheet(_load_qss())
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
         
         # Tab widget for different race types
         self.race_tabs = QTabWidget()
-        self.race_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #404040;
-                background-color: #1a1a1a;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #007bff;
-                color: white;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #404040;
-            }
-        """)
+        self.race_tabs.setObjectName("raceTabs")
         
+        self.race_tabs.currentChanged.connect(self._ensure_built)
         layout.addWidget(self.race_tabs)
     
     def load_recommendations(self):
-        """Load recommendations from JSON file"""
-        try:
-            # Get the path to the recommendations file
-            file_path = os.path.join(get_data_dir(), "stat_recommendations.json")
-            
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.recommendations_data = json.load(f)
-                self.display_recommendations()
-                Logger.info("Stat recommendations loaded successfully")
-            else:
-                self.show_error_message(f"File not found: {file_path}")
-                Logger.error(f"Stat recommendations file not found: {file_path}")
-                
-        except Exception as e:
-            self.show_error_message(f"Failed to load recommendations: {e}")
-            Logger.error(f"Failed to load stat recommendations: {e}")
+        """Load recommendations from JSON file (read and parsed off the UI thread)"""
+        # Get the path to the recommendations file
+        file_path = os.path.join(get_data_dir(), "stat_recommendations.json")
+
+        baked = _baked_recommendations(file_path)
+        if baked is not None:
+            # Already in memory: no file read or parse needed
+            self._load_token += 1
+            self._on_loaded(self._load_token, baked)
+            return
+
+        if not os.path.exists(file_path):
+            self.show_error_message(f"File not found: {file_path}")
+            Logger.error(f"Stat recommendations file not found: {file_path}")
+            return
+
+        self._load_token += 1
+        loader = _Loader(file_path, self._load_token)
+        loader.signals.loaded.connect(self._on_loaded)
+        loader.signals.failed.connect(self._on_load_failed)
+        # Keep the signals object alive until the result is delivered
+        self._loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    @pyqtSlot(int, object)
+    def _on_loaded(self, token: int, data: Dict):
+        """Show freshly loaded recommendations (runs on the UI thread)"""
+        if token != self._load_token:
+            return  # A newer load is in flight
+        if data is self.recommendations_data and self.race_tabs.count():
+            return  # File unchanged since the tabs were built
+        self.recommendations_data = data
+        self.display_recommendations()
+        Logger.info("Stat recommendations loaded successfully")
+
+    @pyqtSlot(int, str)
+    def _on_load_failed(self, token: int, error: str):
+        if token != self._load_token:
+            return
+        self.show_error_message(f"Failed to load recommendations: {error}")
+        Logger.error(f"Failed to load stat recommendations: {error}")
     
     def display_recommendations(self):
-        """Display the recommendations in the UI"""
-        # Clear existing tabs
-        self.race_tabs.clear()
-        
-        if not self.recommendations_data:
+        """Display the recommendations, updating tabs of known race types in place"""
+        data = self.recommendations_data or {}
+        keep = {race: tab for race, tab in self._tabs.items() if race in data}
+
+        self.race_tabs.setUpdatesEnabled(False)
+        self.race_tabs.blockSignals(True)
+        try:
+            # Drop tabs for race types that are gone (and any error tab)
+            for i in reversed(range(self.race_tabs.count())):
+                tab = self.race_tabs.widget(i)
+                if tab not in keep.values():
+                    self.race_tabs.removeTab(i)
+                    self._pending_tabs.pop(tab, None)
+                    tab.deleteLater()
+            self._canvases = {race: c for race, c in self._canvases.items() if race in keep}
+            self._tabs = keep
+
+            for race_type, stats in data.items():
+                tab = self._tabs.get(race_type)
+                if tab is None:
+                    tab = self.create_race_tab(race_type, stats)
+                    self._tabs[race_type] = tab
+                    self.race_tabs.addTab(tab, race_type)
+                elif tab in self._pending_tabs:
+                    self._pending_tabs[tab] = (race_type, stats)
+                else:
+                    self._canvases[race_type].set_stats(stats)
+        finally:
+            self.race_tabs.blockSignals(False)
+            self.race_tabs.setUpdatesEnabled(True)
+
+        if not data:
             self.show_error_message("No recommendations data available")
             return
-        
-        # Create tab for each race type
-        for race_type, stats in self.recommendations_data.items():
-            tab = self.create_race_tab(race_type, stats)
-            self.race_tabs.addTab(tab, race_type)
-    
+        # currentChanged was blocked above: build the visible tab now
+        self._ensure_built(self.race_tabs.currentIndex())
+
+    @pyqtSlot(int)
+    def _ensure_built(self, index: int):
+        """Fill in the race tab at *index* if it has not been built yet"""
+        pending = self._pending_tabs.pop(self.race_tabs.widget(index), None)
+        if pending:
+            self.build_race_tab(self.race_tabs.widget(index), *pending)
+
     def create_race_tab(self, race_type: str, stats: Dict[str, str]) -> QWidget:
-        """Create a tab widget for a specific race type"""
+        """Create an empty tab for a race type; contents are built when first shown"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(15)
-        
-        # Scroll area for content
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #404040;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #555555;
-            }
-        """)
-        
+        self._pending_tabs[tab] = (race_type, stats)
+        return tab
+
+    def build_race_tab(self, tab: QWidget, race_type: str, stats: Dict[str, str]):
+        """Fill *tab* with the stats and tips cards for a race type"""
+        layout = tab.layout()
+
         # Content widget
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
@@ -133,6 +323,7 @@ class StatRecommendationsTab(QWidget):
         
         # Create stats card
         stats_card = self.create_stats_card(stats)
+        self._canvases[race_type] = stats_card.findChild(StatsCanvas)
         content_layout.addWidget(stats_card)
         
         # Add tips
@@ -143,120 +334,76 @@ class StatRecommendationsTab(QWidget):
         
         # Add stretch to push content to top
         content_layout.addStretch(1)
-        
+
+        # The two cards usually fit: only pay for a scroll area when they would not
+        margins = layout.contentsMargins()
+        available = tab.height() - margins.top() - margins.bottom()
+        if tab.isVisible() and content_widget.sizeHint().height() <= available:
+            layout.addWidget(content_widget)
+            return
+
+        # Scroll area for content
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        scroll_area.setObjectName("raceScroll")
         scroll_area.setWidget(content_widget)
         layout.addWidget(scroll_area)
-        
-        return tab
     
     def create_stats_card(self, stats: Dict[str, str]) -> QFrame:
         """Create a card widget for stats display"""
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        card.setObjectName("statsCard")
         
         layout = QVBoxLayout(card)
         layout.setSpacing(15)
         
         # Title
         title_label = QLabel("📊 Recommended Stats")
-        title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        title_label.setStyleSheet("color: #ffffff; margin-bottom: 10px;")
+        title_label.setFont(_font(14, bold=True))
+        title_label.setObjectName("statsTitle")
         layout.addWidget(title_label)
         
-        # Stats grid
-        stats_layout = QGridLayout()
-        stats_layout.setSpacing(12)
-        
-        # Define stat colors and icons with softer colors
-        stat_configs = {
-            'SPD': {'color': '#dc3545', 'icon': '🏃', 'name': 'Speed'},
-            'STA': {'color': '#28a745', 'icon': '💚', 'name': 'Stamina'},
-            'PWR': {'color': '#fd7e14', 'icon': '💪', 'name': 'Power'},
-            'WIT': {'color': '#6f42c1', 'icon': '🧠', 'name': 'Wisdom'}
-        }
-        
-        row = 0
-        for stat_code, stat_value in stats.items():
-            if stat_code in stat_configs:
-                config = stat_configs[stat_code]
-                
-                # Stat icon and name
-                stat_label = QLabel(f"{config['icon']} {config['name']}")
-                stat_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-                stat_label.setStyleSheet(f"color: {config['color']};")
-                stats_layout.addWidget(stat_label, row, 0)
-                
-                # Stat value
-                value_label = QLabel(stat_value)
-                value_label.setFont(QFont("Arial", 13, QFont.Weight.Bold))
-                value_label.setStyleSheet(f"""
-                    color: white;
-                    background-color: {config['color']};
-                    padding: 8px 15px;
-                    border-radius: 6px;
-                    border: none;
-                """)
-                value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                stats_layout.addWidget(value_label, row, 1)
-                
-                row += 1
-        
-        layout.addLayout(stats_layout)
+        # Stats rows, painted directly
+        layout.addWidget(StatsCanvas(stats))
         return card
     
     def create_tips_card(self, tips: str) -> QFrame:
         """Create a card widget for tips"""
         card = QFrame()
         card.setFrameStyle(QFrame.Shape.StyledPanel)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: #1e3a5f;
-                border: 1px solid #2d5a8b;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        card.setObjectName("tipsCard")
         
         layout = QVBoxLayout(card)
         layout.setSpacing(8)
         
         # Tips title
         tips_title = QLabel("💡 Tips")
-        tips_title.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        tips_title.setStyleSheet("color: #64b5f6;")
+        tips_title.setFont(_font(12, bold=True))
+        tips_title.setObjectName("tipsTitle")
         layout.addWidget(tips_title)
         
         # Tips content
         tips_label = QLabel(tips)
-        tips_label.setFont(QFont("Arial", 10))
-        tips_label.setStyleSheet("color: #e0e0e0; line-height: 1.4;")
+        tips_label.setFont(_font(10))
+        tips_label.setObjectName("tipsText")
         tips_label.setWordWrap(True)
         layout.addWidget(tips_label)
         
         return card
     
-    def get_race_tips(self, race_type: str) -> str:
+    @staticmethod
+    def get_race_tips(race_type: str) -> str:
         """Get tips for specific race type"""
-        tips = {
-            "Sprint/Mile": "Focus on Speed and Power. Stamina is less critical for short races.",
-            "Medium": "Balanced approach with emphasis on Speed and Stamina. Power helps with acceleration.",
-            "Long": "Stamina is crucial. Speed and Power are still important but Stamina should be prioritized."
-        }
-        return tips.get(race_type, "")
+        return _RACE_TIPS.get(race_type, "")
     
     def show_error_message(self, message: str):
         """Show error message in the UI"""
         error_label = QLabel(f"❌ {message}")
-        error_label.setFont(QFont("Arial", 12))
-        error_label.setStyleSheet("color: #dc3545; padding: 20px; text-align: center;")
+        error_label.setFont(_font(12))
+        error_label.setObjectName("errorLabel")
         error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Add to the first tab if available, otherwise create a new tab
@@ -272,5 +419,12 @@ class StatRecommendationsTab(QWidget):
             self.race_tabs.addTab(error_tab, "Error")
     
     def refresh_data(self):
-        """Refresh the recommendations data"""
+        """Refresh the recommendations data (back-to-back calls collapse into one load)"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._run_refresh)
+
+    def _run_refresh(self):
+        self._refresh_pending = False
         self.load_recommendations() 
\ No newline at end of file
@@ -1,24 +1,86 @@
 import json
 import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
 from event_scanner.utils.paths import get_data_dir
+from event_scanner.utils import FileManager
+from event_scanner.ui.events_model import EventsModel
 import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
     QPushButton, QComboBox, QScrollArea, QFrame, QGroupBox,
-    QTextEdit, QSplitter, QListWidget, QListWidgetItem,
-    QMessageBox, QProgressBar, QCheckBox, QLineEdit, QDialog
+    QTextEdit, QSplitter, QListView,
+    QMessageBox, QProgressBar, QCheckBox, QLineEdit, QDialog, QApplication
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QPixmap, QIcon
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QAbstractListModel, QModelIndex, QSize,
+    QSortFilterProxyModel, QStringListModel
+)
+from PyQt6.QtGui import QFont, QPixmap, QIcon, QKeySequence, QShortcut
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import ijson  # Optional: stream events.json section by section
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Separator lines of the events results view
+_SEP_EQ = "=" * 70
+_SEP_DASH = "-" * 30
+# Keystrokes in a dialog's search box within this many ms share one filter pass
+FILTER_DEBOUNCE_MS = 120
+# Bump when the pickled index layout changes so stale sidecars are rebuilt
+EVENTS_CACHE_VERSION = 5
+
+# search_events filter flags (checkbox states packed into the query cache key)
+_F_TYPE, _F_CHARACTER, _F_SCENARIO, _F_CARDS, _F_MATCH_ALL = 1, 2, 4, 8, 16
+# Distinct filter/selection combinations whose results are kept per load
+QUERY_CACHE_SIZE = 64
+
+# Indexed event: the fields the search and results view read, bound once at load
+Event = namedtuple('Event', 'id type name choices')
+
+class _LoadWorker(QThread):
+    """Read/index events.json off the UI thread (see TrainingEventsTab.load_indexes)"""
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, data_file: str, cache_file: str, parent=None):
+        super().__init__(parent)
+        self.data_file = data_file
+        self.cache_file = cache_file
+
+    def run(self):
+        try:
+            result = TrainingEventsTab.load_indexes(self.data_file, self.cache_file)
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.failed.emit(str(e))
+            return
+        # Nobody is listening any more once the tab is shutting down
+        if not self.isInterruptionRequested():
+            self.loaded.emit(result)
+
 
 class TrainingEventsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         # Get the correct path for data file
         self.data_file = os.path.join(get_data_dir(), "events.json")
-        self.training_data = None
+        # Indexes built from data_file, reused while its mtime/size are unchanged
+        self.cache_file = os.path.join(get_data_dir(), "events.cache.pkl")
+        # True once events.json has been read and indexed (the raw tree is not kept)
+        self._data_loaded = False
+        self._load_worker: Optional[_LoadWorker] = None
         self.filtered_events = []
         self.selected_event_type = None
         self.selected_character = None
@@ -30,6 +92,19 @@ class TrainingEventsTab(QWidget):
         self.characters = []
         self.scenarios = []
         self.support_cards = []
+
+        # Name -> frozenset of event IDs, built once per load for O(1) membership tests
+        self._char_event_sets: Dict[str, frozenset] = {}
+        self._card_event_sets: Dict[str, frozenset] = {}
+        self._type_event_sets: Dict[str, frozenset] = {}
+        # Event ID -> event (first occurrence, file order) and its position in that order
+        self._events_by_id: Dict[str, Event] = {}
+        self._event_pos: Dict[str, int] = {}
+        # Event type -> events of that type, in file order
+        self._events_by_type: Dict[str, List[Event]] = {}
+        self._scenario_event_map: Dict[str, frozenset] = {}
+        # Memoized _run_query; cleared whenever new indexes are adopted
+        self._query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._run_query)
         
         self.init_ui()
         self.load_data()
@@ -124,10 +199,16 @@ class TrainingEventsTab(QWidget):
         self.show_card_events.setChecked(True)
         self.show_card_events.toggled.connect(self.apply_filters)
         
+        # Off: an event matching any active filter is shown; on: it must match all of them
+        self.match_all_filters = QCheckBox("Chỉ hiện event khớp tất cả bộ lọc (AND)")
+        self.match_all_filters.setChecked(False)
+        self.match_all_filters.toggled.connect(self.apply_filters)
+        
         filter_layout.addWidget(self.show_type_events)
         filter_layout.addWidget(self.show_character_events)
         filter_layout.addWidget(self.show_scenario_events)
         filter_layout.addWidget(self.show_card_events)
+        filter_layout.addWidget(self.match_all_filters)
         filter_group.setLayout(filter_layout)
         layout.addWidget(filter_group)
         
@@ -173,74 +254,185 @@ class TrainingEventsTab(QWidget):
         self.events_count.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.events_count)
         
-        # Events display
-        self.events_display = QTextEdit()
-        self.events_display.setReadOnly(True)
+        # Events display: one model row per text line, only visible rows are laid out
+        self.events_model = EventsModel(self)
+        self.events_display = QListView()
+        self.events_display.setModel(self.events_model)
+        self.events_display.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Lines can be selected and copied (Ctrl+C), like text in the old read-only QTextEdit
+        self.events_display.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.events_display.setFont(QFont("Consolas", 10))
+        # Never elide: long effect lines scroll horizontally (see _show_results)
+        self.events_display.setTextElideMode(Qt.TextElideMode.ElideNone)
+        self.events_display.setHorizontalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.events_display.setUniformItemSizes(True)
+        self.events_display.setLayoutMode(QListView.LayoutMode.Batched)
+        self.events_display.setBatchSize(256)
+        copy_shortcut = QShortcut(QKeySequence.StandardKey.Copy, self.events_display)
+        copy_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_shortcut.activated.connect(self.copy_selected_events)
         layout.addWidget(self.events_display)
         
         panel.setLayout(layout)
         return panel
         
     def load_data(self):
-        """Load training events data from JSON file and extract real data"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    self.training_data = json.load(f)
-                
-                self.extract_real_data()
-                self.populate_selections()
-                
-                total_events = len(self.training_data.get('events', []))
-                total_types = len(self.event_types)
-                total_characters = len(self.characters)
-                total_scenarios = len(self.scenarios)
-                
-                status_text = f"Đã tải {total_events} events, {total_types} loại, {total_characters} nhân vật, {total_scenarios} kịch bản."
-                self.status_label.setText(status_text)
-                self.display_events()
-            else:
-                self.status_label.setText(f"Không tìm thấy tệp dữ liệu: {self.data_file}")
-                QMessageBox.warning(self, "Không tìm thấy dữ liệu", f"Không tìm thấy tệp dữ liệu training events:\n{self.data_file}")
-        except Exception as e:
-            self.status_label.setText(f"Lỗi khi tải dữ liệu: {e}")
-            QMessageBox.critical(self, "Lỗi", f"Không thể tải dữ liệu: {e}")
-            
-    def extract_real_data(self):
-        """Extract real event types, characters, and support cards from the data"""
-        if not self.training_data:
+        """Load training events data on a worker thread; the UI is filled in when it arrives"""
+        if not os.path.exists(self.data_file):
+            self.status_label.setText(f"Không tìm thấy tệp dữ liệu: {self.data_file}")
+            QMessageBox.warning(self, "Không tìm thấy dữ liệu", f"Không tìm thấy tệp dữ liệu training events:\n{self.data_file}")
             return
-            
-        events = self.training_data.get('events', [])
-        characters = self.training_data.get('characters', [])
-        support_cards = self.training_data.get('supportCards', [])
-        scenarios_data = self.training_data.get('scenarios', [])
 
-        # Existing lists
-        self.event_types = sorted(list(set(event.get('type', 'Unknown') for event in events)))
-        self.characters = sorted(list(set(char.get('name', '').replace(' (Original)', '') for char in characters if char.get('name'))))
-        self.support_cards = sorted(list(set(card.get('name', '') for card in support_cards if card.get('name'))))
+        self.status_label.setText("Đang tải…")
+        self.events_model.set_rows(["Đang tải…"])
+        self._load_worker = _LoadWorker(self.data_file, self.cache_file, self)
+        self._load_worker.loaded.connect(self._on_data_loaded)
+        self._load_worker.failed.connect(self._on_data_failed)
+        self._load_worker.start()
+
+    def stop_loading(self):
+        """Wait for a running index build so its QThread is not destroyed while running.
+
+        The build itself cannot be aborted midway; interruption only stops it
+        from reporting back. Called by MainWindow.closeEvent.
+        """
+        worker = self._load_worker
+        if worker is not None and worker.isRunning():
+            worker.requestInterruption()
+            worker.wait()
+
+    def _on_data_loaded(self, result: Dict):
+        """Adopt the indexes built by _LoadWorker (runs on the UI thread)"""
+        for attr, value in result['indexes'].items():
+            setattr(self, attr, value)
+        self._query.cache_clear()
+        self._data_loaded = True
+        self.populate_selections()
+
+        total_events = result['total_events']
+        total_types = len(self.event_types)
+        total_characters = len(self.characters)
+        total_scenarios = len(self.scenarios)
+
+        status_text = f"Đã tải {total_events} events, {total_types} loại, {total_characters} nhân vật, {total_scenarios} kịch bản."
+        self.status_label.setText(status_text)
+        self.display_events()
+
+    def _on_data_failed(self, error: str):
+        self.status_label.setText(f"Lỗi khi tải dữ liệu: {error}")
+        QMessageBox.critical(self, "Lỗi", f"Không thể tải dữ liệu: {error}")
+
+    @staticmethod
+    def load_indexes(data_file: str, cache_file: str) -> Dict[str, Any]:
+        """Indexes for *data_file*, from the cache sidecar when current, else built and cached.
+
+        Returns ``{'indexes': {attr: value}, 'total_events': int}``. Touches no
+        widgets, so it can run off the UI thread.
+        """
+        st = os.stat(data_file)
+        key = (EVENTS_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        cached = FileManager.load_pickle(cache_file)
+        if isinstance(cached, dict) and cached.get('key') == key:
+            return cached
+
+        indexes, total_events = TrainingEventsTab.extract_real_data(*TrainingEventsTab._read_sections(data_file))
+        result = {'key': key, 'total_events': total_events, 'indexes': indexes}
+        FileManager.save_pickle(result, cache_file)
+        return result
+
+    @staticmethod
+    def _read_sections(path: str) -> List[Iterable[Dict]]:
+        """events / characters / supportCards / scenarios entries of *path*.
+
+        With ijson each section is streamed lazily (one pass over the file per
+        section), so the whole JSON tree is never held in memory at once.
+        """
+        keys = ('events', 'characters', 'supportCards', 'scenarios')
+        if IJSON_AVAILABLE:
+            return [TrainingEventsTab._stream_section(path, key) for key in keys]
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+        return [data.get(key, []) for key in keys]
+
+    @staticmethod
+    def _stream_section(path: str, key: str) -> Iterator[Dict]:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, f'{key}.item', use_float=True)
+
+    @staticmethod
+    def extract_real_data(events: Iterable[Dict], characters: Iterable[Dict],
+                          support_cards: Iterable[Dict], scenarios_data: Iterable[Dict]):
+        """Build the selection lists and lookup indexes.
+
+        Returns ``(indexes, total_events)`` where *indexes* maps tab attribute
+        names to their values (this is what the cache sidecar stores).
+        """
+        event_id_set = TrainingEventsTab._event_id_set
+        intern = sys.intern
+
+        # One pass over the events: unique-ID index and per-type grouping
+        events_by_id: Dict[str, Event] = {}
+        events_by_type: Dict[str, List[Event]] = {}
+        total_events = 0
+        for event in events:
+            total_events += 1
+            # Interned: the same ID/type strings recur across every index and set
+            event_id = intern(event.get('id', ''))
+            if event_id in events_by_id:
+                continue
+            choices = event.get('choices', [])
+            for choice in choices:
+                choice['_effect_lines'] = TrainingEventsTab._effect_lines(choice.get('effects', []))
+            ev = Event(event_id, intern(event.get('type', 'Unknown')), event.get('event', 'Unknown Event'), choices)
+            events_by_id[event_id] = ev
+            events_by_type.setdefault(ev.type, []).append(ev)
+
+        char_event_sets = {}
+        for char in characters:
+            char_event_sets[intern(char.get('name', '').replace(' (Original)', ''))] = event_id_set(char)
 
-        # Scenario list extracted from dedicated section
-        self.scenarios = sorted([scn.get('id', '') for scn in scenarios_data if scn.get('id')])
+        card_event_sets = {}
+        for card in support_cards:
+            card_event_sets[intern(card.get('name', ''))] = event_id_set(card)
 
-        # Build scenario -> eventIds map for quick filtering
+        # Scenario -> eventIds map for quick filtering
         scenario_event_map = {}
         for scn in scenarios_data:
             scn_id = scn.get('id', '')
-            if not scn_id:
-                continue
-            event_ids = [eid for group in scn.get('eventGroups', []) for eid in group.get('eventIds', [])]
-            scenario_event_map[scn_id] = event_ids
-
-        # Store helper lists/maps into training_data without overwriting original structures
-        self.training_data['event_types'] = self.event_types
-        self.training_data['character_names'] = self.characters  # keep original 'characters' intact
-        self.training_data['scenario_ids'] = self.scenarios      # keep original 'scenarios' intact
-        self.training_data['support_card_names'] = self.support_cards
-        self.training_data['scenario_event_map'] = scenario_event_map
-            
+            if scn_id:
+                scenario_event_map[intern(scn_id)] = event_id_set(scn)
+
+        indexes = {
+            'event_types': sorted(events_by_type),
+            'characters': sorted(name for name in char_event_sets if name),
+            'scenarios': sorted(scenario_event_map),
+            'support_cards': sorted(name for name in card_event_sets if name),
+            '_events_by_id': events_by_id,
+            '_event_pos': {event_id: i for i, event_id in enumerate(events_by_id)},
+            '_events_by_type': events_by_type,
+            '_type_event_sets': {
+                t: frozenset(e.id for e in evs) for t, evs in events_by_type.items()
+            },
+            '_char_event_sets': char_event_sets,
+            '_card_event_sets': card_event_sets,
+            '_scenario_event_map': scenario_event_map,
+        }
+        return indexes, total_events
+
+    @staticmethod
+    def _effect_lines(segs) -> tuple:
+        """Non-empty display lines for a choice's effect segments"""
+        if not isinstance(segs, list):
+            return ()
+        lines = ('or' if seg.get('kind') == 'divider_or' else seg.get('raw', '').strip()
+                 for seg in segs if isinstance(seg, dict))
+        return tuple(line for line in lines if line)
+
+    @staticmethod
+    def _event_id_set(entry: Dict) -> frozenset:
+        """All event IDs referenced by a character/card/scenario entry"""
+        return frozenset(sys.intern(eid) for group in entry.get('eventGroups', []) for eid in group.get('eventIds', []))
+
     def populate_selections(self):
         """Populate selection data for popup dialogs"""
         self.update_button_texts()
@@ -268,100 +460,131 @@ class TrainingEventsTab(QWidget):
         
     def search_events(self):
         """Search for events based on current selections using real data"""
-        if not self.training_data:
+        if not self._data_loaded:
             QMessageBox.warning(self, "Không có dữ liệu", "Dữ liệu training chưa được tải.")
             return
             
-        self.filtered_events = []
-        all_events = self.training_data.get('events', [])
-        characters_data = self.training_data.get('characters', [])
-        support_cards_data = self.training_data.get('supportCards', [])
-        scenario_event_map = self.training_data.get('scenario_event_map', {})
-
-        # Build maps for faster lookups
-        char_event_map = {char.get('name', '').replace(' (Original)', ''): [eid for group in char.get('eventGroups', []) for eid in group.get('eventIds', [])] for char in characters_data}
-        card_event_map = {card.get('name', ''): [eid for group in card.get('eventGroups', []) for eid in group.get('eventIds', [])] for card in support_cards_data}
-
         has_selection = any([self.selected_event_type, self.selected_character, self.selected_scenario, self.selected_cards])
         if not has_selection:
+            self.filtered_events = []
             self.display_events()
             return
-        
-        seen_ids = set()  # track event IDs we've already added
-        for event in all_events:
-            event_id = event.get('id', '')
-            event_type = event.get('type', 'Unknown')
-            
-            # Use a set to gather reasons for inclusion to avoid duplicate checks
-            include_reasons = set()
-
-            # Check type
-            if self.show_type_events.isChecked() and self.selected_event_type and event_type == self.selected_event_type:
-                include_reasons.add('type')
-
-            # Check character
-            if self.show_character_events.isChecked() and self.selected_character and event_id in char_event_map.get(self.selected_character, []):
-                include_reasons.add('character')
-
-            # Check scenario
-            if self.show_scenario_events.isChecked() and self.selected_scenario and event_id in scenario_event_map.get(self.selected_scenario, []):
-                include_reasons.add('scenario')
-
-            # Check support cards
-            if self.show_card_events.isChecked() and self.selected_cards:
-                for card_name in self.selected_cards:
-                    if event_id in card_event_map.get(card_name, []):
-                        include_reasons.add('card')
-                        break # No need to check other cards if one matches
-            
-            if include_reasons and event_id not in seen_ids:
-                self.filtered_events.append(event)
-                seen_ids.add(event_id)
-                
+
+        flags = 0
+        if self.show_type_events.isChecked():
+            flags |= _F_TYPE
+        if self.show_character_events.isChecked():
+            flags |= _F_CHARACTER
+        if self.show_scenario_events.isChecked():
+            flags |= _F_SCENARIO
+        if self.show_card_events.isChecked():
+            flags |= _F_CARDS
+        if self.match_all_filters.isChecked():
+            flags |= _F_MATCH_ALL
+        self.filtered_events = list(self._query(self.selected_event_type, self.selected_character,
+                                                self.selected_scenario, tuple(self.selected_cards), flags))
         self.display_events()
 
+    def _run_query(self, event_type: Optional[str], character: Optional[str], scenario: Optional[str],
+                   cards: tuple, flags: int) -> tuple:
+        """Events (file order) matching the selections; depends only on its arguments and the indexes"""
+        empty = frozenset()
+        type_active = bool(flags & _F_TYPE and event_type)
+        others_active = any([
+            flags & _F_CHARACTER and character,
+            flags & _F_SCENARIO and scenario,
+            flags & _F_CARDS and cards,
+        ])
+        if type_active and not others_active:
+            # Only the type filter applies: its events were grouped at load time
+            return tuple(self._events_by_type.get(event_type, ()))
+
+        # Event IDs allowed by each active filter (the selected cards together form one filter)
+        id_sets = []
+        if type_active:
+            id_sets.append(self._type_event_sets.get(event_type, empty))
+        if flags & _F_CHARACTER and character:
+            id_sets.append(self._char_event_sets.get(character, empty))
+        if flags & _F_SCENARIO and scenario:
+            id_sets.append(self._scenario_event_map.get(scenario, empty))
+        if flags & _F_CARDS and cards:
+            id_sets.append(empty.union(*(self._card_event_sets.get(name, empty) for name in cards)))
+
+        if flags & _F_MATCH_ALL:
+            # AND: intersect the most selective sets first so the working set shrinks early
+            id_sets.sort(key=len)
+            allowed_ids = set(id_sets[0]) if id_sets else set()
+            for ids in id_sets[1:]:
+                if not allowed_ids:
+                    break
+                allowed_ids.intersection_update(ids)
+        else:
+            # OR: start from the largest set and stop once every event is already allowed
+            id_sets.sort(key=len, reverse=True)
+            allowed_ids = set()
+            total = len(self._events_by_id)
+            for ids in id_sets:
+                allowed_ids |= ids
+                if len(allowed_ids) >= total and allowed_ids.issuperset(self._events_by_id):
+                    break
+
+        # Look the allowed IDs up directly, in file order
+        allowed_ids.intersection_update(self._events_by_id)
+        return tuple(self._events_by_id[eid] for eid in sorted(allowed_ids, key=self._event_pos.__getitem__))
+
     def display_events(self):
-        """Display filtered events in the text area"""
+        """Display filtered events in the results list"""
         if not self.filtered_events:
-            self.events_count.setText("Không tìm thấy event nào phù hợp.")
-            self.events_display.setText("Vui lòng điều chỉnh tiêu chí lựa chọn và tìm kiếm lại.")
+            self._show_results("Không tìm thấy event nào phù hợp.",
+                               ["Vui lòng điều chỉnh tiêu chí lựa chọn và tìm kiếm lại."])
             return
             
-        self.events_count.setText(f"Tìm thấy {len(self.filtered_events)} event duy nhất")
-        display_text = ""
+        rows = []
         events_by_type = {}
         for event in self.filtered_events:
-            event_type = event.get('type', 'Unknown')
-            if event_type not in events_by_type:
-                events_by_type[event_type] = []
-            events_by_type[event_type].append(event)
+            events_by_type.setdefault(event.type, []).append(event)
             
-        for event_type, events in sorted(events_by_type.items()):
-            display_text += f"\n{'='*70}\n"
-            display_text += f"📋 {event_type.upper()} ({len(events)} events)\n"
-            display_text += f"{'='*70}\n\n"
+        # self.event_types is already sorted and covers every indexed type
+        for event_type in self.event_types:
+            events = events_by_type.get(event_type)
+            if not events:
+                continue
+            rows.append("")
+            rows.append(_SEP_EQ)
+            rows.append(f"📋 {event_type.upper()} ({len(events)} events)")
+            rows.append(_SEP_EQ)
+            rows.append("")
             
             for i, event in enumerate(events, 1):
-                display_text += f"Event: {event.get('event', 'Unknown Event')}\n"
-                choices = event.get('choices', [])
+                rows.append(f"Event: {event.name}")
+                choices = event.choices
                 if choices:
-                    display_text += "  Lựa chọn:\n"
+                    rows.append("  Lựa chọn:")
                     for j, choice in enumerate(choices, 1):
-                        display_text += f"    {j}. {choice.get('choice', 'Không có mô tả')}\n"
-                        raw_lines = []
-                        segs = choice.get('effects', [])
-                        if isinstance(segs, list):
-                            for seg in segs:
-                                if seg.get('kind') == 'divider_or':
-                                    raw_lines.append('or')
-                                else:
-                                    raw_lines.append(seg.get('raw', ''))
-                        for line in raw_lines:
-                            if line.strip():
-                                display_text += f"       → {line.strip()}\n"
-                display_text += "-"*30 + "\n"
+                        rows.append(f"    {j}. {choice.get('choice', 'Không có mô tả')}")
+                        rows.extend(f"       → {line}" for line in choice['_effect_lines'])
+                rows.append(_SEP_DASH)
                 
-        self.events_display.setText(display_text)
+        self._show_results(f"Tìm thấy {len(self.filtered_events)} event duy nhất", rows)
+
+    def _show_results(self, count_text: str, rows: List[str]):
+        """Swap in the count label and result rows as a single repaint"""
+        # Uniform item sizes take every row's size from one hint, so make it fit the widest line
+        fm = self.events_display.fontMetrics()
+        width = max((fm.horizontalAdvance(row) for row in rows), default=0)
+        row_size = QSize(width + 2 * fm.averageCharWidth(), fm.height() + 4)
+        self.setUpdatesEnabled(False)
+        try:
+            self.events_count.setText(count_text)
+            self.events_model.set_rows(rows, row_size)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def copy_selected_events(self):
+        """Copy the selected result lines to the clipboard, in display order"""
+        indexes = sorted(self.events_display.selectionModel().selectedIndexes(), key=QModelIndex.row)
+        if indexes:
+            QApplication.clipboard().setText("\n".join(index.data() for index in indexes))
 
     def open_type_selection(self):
         """Open popup dialog for event type selection"""
@@ -432,13 +655,24 @@ class SelectionDialog(QDialog):
         # Search box
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Tìm kiếm...")
+        self._filter_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self.search_edit.textChanged.connect(self.filter_items)
         layout.addWidget(self.search_edit)
         
-        # List widget
-        self.list_widget = QListWidget()
-        self.list_widget.itemDoubleClicked.connect(self.accept)
-        layout.addWidget(self.list_widget)
+        # List view over a filter proxy: filtering runs inside Qt, not per row in Python
+        self.model = QStringListModel(self.items, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.doubleClicked.connect(self.accept)
+        layout.addWidget(self.list_view)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -459,37 +693,87 @@ class SelectionDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Populate list
+        # Select the current item
         self.populate_list()
         
     def populate_list(self):
-        self.list_widget.clear()
-        for item in self.items:
-            list_item = QListWidgetItem(item)
-            if item == self.selected_item:
-                list_item.setSelected(True)
-                self.list_widget.scrollToItem(list_item)
-            self.list_widget.addItem(list_item)
+        if self.selected_item in self.items:
+            index = self.proxy.mapFromSource(self.model.index(self.items.index(self.selected_item)))
+            self.list_view.setCurrentIndex(index)
+            self.list_view.scrollTo(index)
             
     def filter_items(self, text):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item:
-                item.setHidden(text.lower() not in item.text().lower())
+        """Queue a filter pass; restarts while the user keeps typing"""
+        self._filter_text = text
+        self._filter_timer.start(FILTER_DEBOUNCE_MS)
+
+    def _apply_filter(self):
+        self.proxy.setFilterFixedString(self._filter_text)
             
     def clear_selection(self):
         self.selected_item = None
         self.accept()
         
     def accept(self):
-        selected_items = self.list_widget.selectedItems()
-        if selected_items:
-            self.selected_item = selected_items[0].text()
-        else: # Handle case where nothing is selected but OK is clicked
-            self.selected_item = self.selected_item 
+        selected = self.list_view.selectionModel().selectedIndexes()
+        if selected:
+            self.selected_item = selected[0].data()
         super().accept()
 
 
+class _CheckListModel(QAbstractListModel):
+    """Checkable names; refuses to check more than *max_checked* at once"""
+    toggled = pyqtSignal(str, bool)
+    limit_reached = pyqtSignal()
+
+    def __init__(self, items, checked, max_checked, parent=None):
+        super().__init__(parent)
+        self._items = items
+        self._checked = set(checked)
+        self._max_checked = max_checked
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def flags(self, index: QModelIndex):
+        return super().flags(index) | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item
+        if role == Qt.ItemDataRole.CheckStateRole:
+            state = Qt.CheckState.Checked if item in self._checked else Qt.CheckState.Unchecked
+            return state.value
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        item = self._items[index.row()]
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        if checked == (item in self._checked):
+            return True
+        if checked and len(self._checked) >= self._max_checked:
+            self.limit_reached.emit()
+            return False
+        if checked:
+            self._checked.add(item)
+        else:
+            self._checked.discard(item)
+        self.dataChanged.emit(index, index, [role])
+        self.toggled.emit(item, checked)
+        return True
+
+    def clear_checks(self):
+        """Uncheck everything"""
+        self.beginResetModel()
+        self._checked.clear()
+        self.endResetModel()
+
+
 class MultiSelectionDialog(QDialog):
     """Dialog for multiple item selection"""
     
@@ -497,6 +781,7 @@ class MultiSelectionDialog(QDialog):
         super().__init__(parent)
         self.items = items
         self.selected_items = current_selections.copy()
+        self._selected_set = set(current_selections)
         self.max_selections = max_selections
         self.setup_ui(title)
         
@@ -516,14 +801,25 @@ class MultiSelectionDialog(QDialog):
         # Search box
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Tìm kiếm...")
+        self._filter_text = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self.search_edit.textChanged.connect(self.filter_items)
         layout.addWidget(self.search_edit)
         
-        # List widget with checkboxes
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(QListWidget.SelectionMode.NoSelection)
-        self.list_widget.itemChanged.connect(self.on_item_changed)
-        layout.addWidget(self.list_widget)
+        # Checkable list view over a filter proxy
+        self.model = _CheckListModel(self.items, self._selected_set, self.max_selections, self)
+        self.model.toggled.connect(self.on_item_toggled)
+        self.model.limit_reached.connect(self.on_limit_reached)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.list_view.setUniformItemSizes(True)
+        layout.addWidget(self.list_view)
         
         # Selection info
         self.info_label = QLabel(f"Đã chọn: {len(self.selected_items)}/{self.max_selections}")
@@ -549,52 +845,35 @@ class MultiSelectionDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Populate list
-        self.populate_list()
-        
-    def populate_list(self):
-        self.list_widget.blockSignals(True)
-        self.list_widget.clear()
-        for item in self.items:
-            list_item = QListWidgetItem(item)
-            list_item.setFlags(list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            if item in self.selected_items:
-                list_item.setCheckState(Qt.CheckState.Checked)
-            else:
-                list_item.setCheckState(Qt.CheckState.Unchecked)
-            self.list_widget.addItem(list_item)
-        self.list_widget.blockSignals(False)
         self.update_info()
         
     def filter_items(self, text):
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item:
-                item.setHidden(text.lower() not in item.text().lower())
+        """Queue a filter pass; restarts while the user keeps typing"""
+        self._filter_text = text
+        self._filter_timer.start(FILTER_DEBOUNCE_MS)
+
+    def _apply_filter(self):
+        self.proxy.setFilterFixedString(self._filter_text)
             
-    def on_item_changed(self, changed_item):
-        if changed_item.checkState() == Qt.CheckState.Checked:
-            if len(self.selected_items) >= self.max_selections:
-                changed_item.setCheckState(Qt.CheckState.Unchecked)
-                QMessageBox.warning(self, "Đã đạt giới hạn", f"Bạn chỉ có thể chọn tối đa {self.max_selections} thẻ.")
-                return
-            if changed_item.text() not in self.selected_items:
-                self.selected_items.append(changed_item.text())
-        else:
-            if changed_item.text() in self.selected_items:
-                self.selected_items.remove(changed_item.text())
+    def on_item_toggled(self, name: str, checked: bool):
+        if checked:
+            if name not in self._selected_set:
+                self._selected_set.add(name)
+                self.selected_items.append(name)
+        elif name in self._selected_set:
+            self._selected_set.discard(name)
+            self.selected_items.remove(name)
             
         self.update_info()
+
+    def on_limit_reached(self):
+        QMessageBox.warning(self, "Đã đạt giới hạn", f"Bạn chỉ có thể chọn tối đa {self.max_selections} thẻ.")
         
     def update_info(self):
         self.info_label.setText(f"Đã chọn: {len(self.selected_items)}/{self.max_selections}")
         
     def clear_selection(self):
-        self.list_widget.blockSignals(True)
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
-        self.list_widget.blockSignals(False)
+        self.model.clear_checks()
+        self._selected_set.clear()
         self.selected_items = []
-        self.update_info() 
\ No newline at end of file
+        self.update_info()
@@ -2,24 +2,55 @@
 File manager utility for Uma Event Scanner
 """
 
-import json
 import os
-import pickle
 from typing import Dict, Any
 from .logger import Logger
 
+try:
+    import orjson  # Optional: C parser/serializer, several times faster than json
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# json and pickle are imported on first use: with orjson installed json is never
+# needed, and pickle is only used by the index sidecar.
+
+def _json_loads(raw: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    import json
+    return json.loads(raw)
+
 class FileManager:
     """File management utilities for JSON and pickle files"""
     
     @staticmethod
-    def save_json(data: dict, filename: str) -> bool:
-        """Save dictionary to JSON file"""
+    def save_json(data: dict, filename: str, durable: bool = False) -> bool:
+        """Save dictionary to JSON file.
+
+        Written to a temporary file and renamed over *filename*, so a crash never
+        leaves a half-written file. Pass ``durable=True`` to fsync before the rename.
+        """
+        tmp = filename + '.tmp'
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                import json
+                raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(tmp, 'wb') as f:
+                f.write(raw)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, filename)
             return True
         except Exception as e:
             Logger.error(f"Failed to save {filename}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
             return False
     
     @staticmethod
@@ -27,8 +58,9 @@ class FileManager:
         """Load dictionary from JSON file"""
         try:
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                return _json_loads(raw)
         except Exception as e:
             Logger.error(f"Failed to load {filename}: {e}")
         return {}
@@ -37,8 +69,9 @@ class FileManager:
     def save_pickle(data: Any, filename: str) -> bool:
         """Save data to pickle file"""
         try:
+            import pickle
             with open(filename, 'wb') as f:
-                pickle.dump(data, f)
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
             return True
         except Exception as e:
             Logger.error(f"Failed to save {filename}: {e}")
@@ -49,6 +82,7 @@ class FileManager:
         """Load data from pickle file"""
         try:
             if os.path.exists(filename):
+                import pickle
                 with open(filename, 'rb') as f:
                     return pickle.load(f)
         except Exception as e:
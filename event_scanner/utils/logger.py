@@ -2,27 +2,99 @@
 Logger utility for Uma Event Scanner
 """
 
-from datetime import datetime
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+
+DEBUG, INFO, WARNING, ERROR = 0, 1, 2, 3
+_LEVEL_NAMES = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'WARN': WARNING, 'ERROR': ERROR}
+
+
+def _parse_level(value) -> int:
+    """UMA_LOG_LEVEL as a number (0-3) or name (DEBUG/INFO/WARNING/ERROR); INFO otherwise"""
+    if value is None:
+        return INFO
+    value = value.strip().upper()
+    if value in _LEVEL_NAMES:
+        return _LEVEL_NAMES[value]
+    try:
+        return min(max(int(value), DEBUG), ERROR)
+    except ValueError:
+        return INFO
+
+
+# Messages below this level are dropped before any formatting (UMA_LOG_LEVEL=DEBUG enables debug)
+LEVEL = _parse_level(os.environ.get('UMA_LOG_LEVEL'))
+
+# Formatted lines wait here; one daemon thread writes them to stdout in batches
+_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _write_loop():
+    """Drain the queue, writing whatever has piled up as one write + flush"""
+    while True:
+        batch = []
+        msg = _queue.get()
+        while msg is not None:
+            batch.append(msg)
+            try:
+                msg = _queue.get_nowait()
+            except queue.Empty:
+                break
+        out = sys.stdout
+        if batch and out is not None:  # stdout is None in windowed (frozen) builds
+            out.write(''.join(batch))
+            out.flush()
+        if msg is None:
+            return
+
+
+def _stop_writer():
+    """Flush pending lines at interpreter exit"""
+    _queue.put(None)
+    _writer.join(timeout=1.0)
+
+
+def _start_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_loop, name="LoggerWriter", daemon=True)
+            _writer.start()
+            atexit.register(_stop_writer)
+
 
 class Logger:
     """Simple logging utility with timestamp"""
-    
+
+    @staticmethod
+    def _log(level: str, message: str):
+        if _writer is None:
+            _start_writer()
+        _queue.put(f"[{time.strftime('%H:%M:%S')}] {level}: {message}\n")
+
     @staticmethod
     def info(message: str):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] INFO: {message}")
-    
+        if LEVEL <= INFO:
+            Logger._log("INFO", message)
+
     @staticmethod
     def error(message: str):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] ERROR: {message}")
-    
+        if LEVEL <= ERROR:
+            Logger._log("ERROR", message)
+
     @staticmethod
     def debug(message: str):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] DEBUG: {message}")
-    
+        if LEVEL > DEBUG:
+            return
+        Logger._log("DEBUG", message)
+
     @staticmethod
     def warning(message: str):
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        print(f"[{timestamp}] WARNING: {message}") 
\ No newline at end of file
+        if LEVEL <= WARNING:
+            Logger._log("WARNING", message)
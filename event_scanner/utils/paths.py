@@ -1,6 +1,10 @@
 import sys, pathlib
+from functools import lru_cache
 from pathlib import Path
 
+# Both are fixed for the life of the process; resolve()/exists() hit the filesystem
+
+@lru_cache(maxsize=1)
 def get_base_dir():
     if getattr(sys, "frozen", False):
         if hasattr(sys, "_MEIPASS"):
@@ -8,6 +12,7 @@ def get_base_dir():
         return Path(sys.executable).parent
     return Path(__file__).resolve().parents[2]
 
+@lru_cache(maxsize=1)
 def get_data_dir():
     base = Path(sys.executable).parent if getattr(sys, "frozen", False) else get_base_dir()
     external = base / "data"
@@ -13,102 +13,175 @@ Run: python tools/check_duplicate_events.py
 """
 
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Set
 
-DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "events.json"
+try:
+    import orjson  # Optional: parses bytes directly, several times faster than json
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import ijson  # Optional: stream each section instead of loading the whole tree
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-if not DATA_PATH.exists():
-    print(f"File not found: {DATA_PATH}")
-    raise SystemExit(1)
+DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "events.json"
 
 # -------------------------------------------------------------
 # Utility: create canonical key for an event (strict deep compare)
 # -------------------------------------------------------------
 
 
-def canonical_event_key(ev: Dict[str, Any]) -> str:
-    """Return deterministic string key based on event content (excluding `id`)."""
+def _freeze(value: Any) -> Any:
+    """Hashable copy of a JSON value that is equal exactly when json.dumps(sort_keys=True) is.
 
-    key_dict = {
-        "event": ev.get("event"),
-        "type": ev.get("type"),
-        # choices with effects in given order
-        "choices": ev.get("choices", []),
-    }
-    # Using ensure_ascii=False preserves non-ASCII chars for readability
-    return json.dumps(key_dict, ensure_ascii=False, sort_keys=True)
+    Containers and scalars are tagged with their kind, so a dict never equals a list of
+    pairs and 1 / 1.0 / True stay distinct; floats compare by repr (like json.dumps).
+    """
 
+    if isinstance(value, dict):
+        return ("d", tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return ("l", tuple(_freeze(v) for v in value))
+    if isinstance(value, float):
+        return ("float", repr(value))
+    return (type(value).__name__, value)
 
-# -------------------------------------------------------------
-# Load JSON
-# -------------------------------------------------------------
-
-with DATA_PATH.open(encoding="utf-8") as fh:
-    data = json.load(fh)
-
-events: List[Dict[str, Any]] = data.get("events", [])
 
+# Frozen choice / choices tuple -> its first instance. Identical choice arrays recur
+# across events, so keys share one object and equality checks stop at identity.
+_choice_intern: Dict[Tuple, Tuple] = {}
 
-# -------------------------------------------------------------
-# Build duplicate map: key -> list[event_id]
-# -------------------------------------------------------------
 
-dup_map: Dict[str, List[str]] = defaultdict(list)
+def canonical_event_key(ev: Dict[str, Any]) -> Tuple:
+    """Return deterministic hashable key based on event content (excluding `id`)."""
 
-for ev in events:
-    key = canonical_event_key(ev)
-    dup_map[key].append(ev["id"])
-
-# Keep only duplicates (len>1)
-duplicates: Dict[str, List[str]] = {k: ids for k, ids in dup_map.items() if len(ids) > 1}
-
-if not duplicates:
-    print("No fully duplicated events found.")
-    raise SystemExit(0)
+    # choices with effects in given order
+    choices = _freeze(ev.get("choices", []))
+    if choices[0] == "l":
+        choices = ("l", tuple(_choice_intern.setdefault(c, c) for c in choices[1]))
+    return (_freeze(ev.get("event")), _freeze(ev.get("type")), _choice_intern.setdefault(choices, choices))
 
 
 # -------------------------------------------------------------
-# Build index: event_id -> list[(owner_type, owner_id)]
+# Load JSON
 # -------------------------------------------------------------
 
-id_to_owners: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
-
-
-def add_links(owner_type: str, owners: List[Dict[str, Any]]):
-    for owner in owners:
-        oid = owner.get("id")
-        for group in owner.get("eventGroups", []):
-            for ev_id in group.get("eventIds", []):
-                id_to_owners[ev_id].append((owner_type, oid))
 
+def iter_section(data: Optional[Dict[str, Any]], name: str) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a top-level array, one at a time when ijson is available."""
 
-add_links("character", data.get("characters", []))
-add_links("support", data.get("supportCards", []))
-add_links("scenario", data.get("scenarios", []))
+    if data is not None:
+        yield from data.get(name, [])
+        return
+    with DATA_PATH.open("rb") as fh:
+        # use_float keeps numbers as float (not Decimal) so keys match the json path
+        yield from ijson.items(fh, f"{name}.item", use_float=True)
 
 
-# -------------------------------------------------------------
-# Report
-# -------------------------------------------------------------
-
-def format_owner_list(lst: List[Tuple[str, str]]) -> str:
+def format_owner_list(lst: Iterable[Tuple[str, str]]) -> str:
     return ", ".join(f"{t}:{oid}" for t, oid in lst)
 
 
-print("Detected duplicate events (fully identical):\n")
-
-for key, ids in duplicates.items():
-    # Use first event's data for display
-    sample = next(ev for ev in events if ev["id"] == ids[0])
-    print(f"- Event: {sample['event']}  |  Type: {sample['type']}")
-    print(
-        f"  Choices count: {len(sample.get('choices', []))}  |  Duplicate IDs ({len(ids)}): {', '.join(ids)}"
-    )
+def main():
+    if not DATA_PATH.exists():
+        print(f"File not found: {DATA_PATH}")
+        raise SystemExit(1)
+
+    data = None if IJSON_AVAILABLE else _loads(DATA_PATH.read_bytes())
+
+    # -------------------------------------------------------------
+    # Build duplicate map: key -> list[event_id]
+    # -------------------------------------------------------------
+
+    # Cheap prefilter: events differing in name, type or choice count cannot be duplicates.
+    # (event, type, len(choices)) -> first event with that prefix while it is still the only
+    # one, or None once the prefix has a second event and its first event is a candidate.
+    first_by_prefix: Dict[Tuple, Any] = {}
+    # (file position, event); sorted back into file order so groups report in baseline order
+    candidates: List[Tuple[int, Dict[str, Any]]] = []
+
+    for pos, ev in enumerate(iter_section(data, "events")):
+        prefix = (_freeze(ev.get("event")), _freeze(ev.get("type")), len(ev.get("choices", [])))
+        if prefix not in first_by_prefix:
+            first_by_prefix[prefix] = (pos, ev)
+            continue
+        first = first_by_prefix[prefix]
+        if first is not None:
+            candidates.append(first)
+            first_by_prefix[prefix] = None
+        candidates.append((pos, ev))
+
+    del first_by_prefix
+    candidates.sort(key=lambda item: item[0])
+
+    dup_map: Dict[Tuple, List[str]] = defaultdict(list)
+    # key -> (event name, type, choices count) of its first event, for the report
+    samples: Dict[Tuple, Tuple[str, str, int]] = {}
+
+    for _, ev in candidates:
+        key = canonical_event_key(ev)
+        dup_map[key].append(ev["id"])
+        if key not in samples:
+            samples[key] = (ev.get("event"), ev.get("type"), len(ev.get("choices", [])))
+
+    # Keep only duplicates (len>1)
+    duplicates: Dict[Tuple, List[str]] = {k: ids for k, ids in dup_map.items() if len(ids) > 1}
+
+    if not duplicates:
+        print("No fully duplicated events found.")
+        raise SystemExit(0)
+
+    # -------------------------------------------------------------
+    # Build index: event_id -> ((owner_type, owner_id), ...)
+    # -------------------------------------------------------------
+
+    # Most IDs have one or two owners, so small tuples beat per-ID lists. Only IDs that
+    # appear in the report are indexed.
+    id_to_owners: Dict[str, Tuple[Tuple[str, str], ...]] = {
+        ev_id: () for ids in duplicates.values() for ev_id in ids
+    }
 
-    for ev_id in ids:
-        owners = id_to_owners.get(ev_id, [])
-        owner_str = format_owner_list(owners) if owners else "<unlinked>"
-        print(f"    • {ev_id} referenced by: {owner_str}")
-    print() 
\ No newline at end of file
+    def add_links(owner_type: str, owners: Iterator[Dict[str, Any]]):
+        for owner in owners:
+            link = (owner_type, owner.get("id"))
+            for group in owner.get("eventGroups", []):
+                for ev_id in group.get("eventIds", []):
+                    prev = id_to_owners.get(ev_id)
+                    if prev is not None:
+                        id_to_owners[ev_id] = prev + (link,)
+
+    add_links("character", iter_section(data, "characters"))
+    add_links("support", iter_section(data, "supportCards"))
+    add_links("scenario", iter_section(data, "scenarios"))
+
+    # -------------------------------------------------------------
+    # Report
+    # -------------------------------------------------------------
+
+    # Build the whole report first and write it in one go
+    out = ["Detected duplicate events (fully identical):\n"]
+
+    for key, ids in duplicates.items():
+        # Use first event's data for display
+        name, ev_type, choices_count = samples[key]
+        out.append(f"- Event: {name}  |  Type: {ev_type}")
+        out.append(
+            f"  Choices count: {choices_count}  |  Duplicate IDs ({len(ids)}): {', '.join(ids)}"
+        )
+
+        for ev_id in ids:
+            owners = id_to_owners.get(ev_id, [])
+            owner_str = format_owner_list(owners) if owners else "<unlinked>"
+            out.append(f"    • {ev_id} referenced by: {owner_str}")
+        out.append("")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+if __name__ == "__main__":
+    main()
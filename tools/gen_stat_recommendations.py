@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Bake data/stat_recommendations.json into an importable Python module.
+
+Writes event_scanner/config/stat_recommendations_data.py containing the
+recommendations as a read-only dict literal, plus a blake2b digest of the
+JSON it was built from. The Stat Recommendations tab imports it instead of
+parsing JSON at startup, and falls back to the JSON file whenever the file's
+content no longer matches (e.g. after editing it or re-running the scrapers).
+
+Run before packaging: python tools/gen_stat_recommendations.py
+"""
+
+import hashlib
+import json
+import pprint
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "data" / "stat_recommendations.json"
+OUT_PATH = ROOT / "event_scanner" / "config" / "stat_recommendations_data.py"
+
+if not SRC_PATH.exists():
+    print(f"File not found: {SRC_PATH}")
+    raise SystemExit(1)
+
+raw = SRC_PATH.read_bytes()
+data = json.loads(raw)
+# Must match _digest() in event_scanner/ui/stat_recommendations_tab.py
+digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+OUT_PATH.write_text(
+    '"""Generated by tools/gen_stat_recommendations.py – do not edit."""\n\n'
+    "from types import MappingProxyType\n\n"
+    "# blake2b-128 of data/stat_recommendations.json this was generated from\n"
+    f"SOURCE_DIGEST = {digest!r}\n\n"
+    f"DATA = MappingProxyType({pprint.pformat(data, sort_dicts=False)})\n",
+    encoding="utf-8",
+)
+print(f"Wrote {OUT_PATH.relative_to(ROOT)} ({len(data)} race types)")